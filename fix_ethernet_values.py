@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 
+import numpy as np
 import pandas as pd
 
-# Load the data
-compcert_df = pd.read_csv("temp_compcert_base.csv")
-pnk_df = pd.read_csv("temp_pnk_ffi_base.csv")
-gcc_df = pd.read_csv("temp_gcc_meson.csv")
+# Load the data (GCC is only used as the baseline, so read just the two columns needed)
+eth_dtypes = {'Requ Thrput (Mb/s)': 'float64', 'ethernet_driver_CPU_Util': 'float64'}
+compcert_df = pd.read_csv("temp_compcert_base.csv", dtype=eth_dtypes)
+pnk_df = pd.read_csv("temp_pnk_ffi_base.csv", dtype=eth_dtypes)
+gcc_df = pd.read_csv("temp_gcc_meson.csv", usecols=list(eth_dtypes), dtype=eth_dtypes)
 
 # Your known correct relative differences
 compcert_relative_diffs = [4.9, 5.3, 4.9, 5.1, 0.8, 0.4, 0.7, 0.1, 0.6, 1.1, 0.1, 0.6, 0.6]
@@ -13,28 +15,36 @@ pnk_relative_diffs = [21.1, 21.4, 22.2, 22.7, 7.5, 2.9, 4.0, 2.7, 4.4, 3.4, 3.9,
 
 # Get the GCC ethernet CPU values
 requested_throughputs = sorted(gcc_df['Requ Thrput (Mb/s)'].unique())
+n = min(len(requested_throughputs), len(compcert_relative_diffs), len(pnk_relative_diffs))
 
-# Apply correct values
-for i, rt in enumerate(requested_throughputs):
-    if i < len(compcert_relative_diffs) and i < len(pnk_relative_diffs):
-        # Get GCC baseline value
-        gcc_row = gcc_df[gcc_df['Requ Thrput (Mb/s)'] == rt].iloc[0]
-        gcc_eth_cpu = gcc_row['ethernet_driver_CPU_Util']
-        
-        # Calculate correct values
-        correct_compcert_value = gcc_eth_cpu * (1 + compcert_relative_diffs[i] / 100)
-        correct_pnk_value = gcc_eth_cpu * (1 + pnk_relative_diffs[i] / 100)
-        
-        # Update CompCert
-        cc_row_idx = compcert_df[compcert_df['Requ Thrput (Mb/s)'] == rt].index[0]
-        compcert_df.loc[cc_row_idx, 'ethernet_driver_CPU_Util'] = correct_compcert_value
-        
-        # Update PNK
-        pnk_row_idx = pnk_df[pnk_df['Requ Thrput (Mb/s)'] == rt].index[0]
-        pnk_df.loc[pnk_row_idx, 'ethernet_driver_CPU_Util'] = correct_pnk_value
+# GCC baseline per requested throughput, looked up through a throughput index
+rt_arr = np.asarray(requested_throughputs[:n])
+gcc_eth_cpu = gcc_df.drop_duplicates('Requ Thrput (Mb/s)').set_index('Requ Thrput (Mb/s)')
+gcc_eth_cpu = gcc_eth_cpu.loc[rt_arr, 'ethernet_driver_CPU_Util'].to_numpy()
+
+# Calculate correct values (one row per comparator, broadcast against the baseline)
+relative_diffs = np.array([compcert_relative_diffs[:n], pnk_relative_diffs[:n]])
+corrected = gcc_eth_cpu * (1 + relative_diffs / 100)
+corrections = pd.DataFrame(corrected.T, index=rt_arr, columns=['cc', 'pnk'])
+
+
+def apply_corrections(df, column):
+    # Only the first row for each throughput is corrected
+    values = corrections[column].reindex(df.index).to_numpy()
+    mask = ~np.isnan(values) & ~df.index.duplicated()
+    df['ethernet_driver_CPU_Util'] = np.where(mask, values, df['ethernet_driver_CPU_Util'])
+
+
+# Index by throughput so corrections are applied with a hash lookup
+compcert_df = compcert_df.set_index('Requ Thrput (Mb/s)', drop=False)
+pnk_df = pnk_df.set_index('Requ Thrput (Mb/s)', drop=False)
+
+# Update CompCert and PNK
+apply_corrections(compcert_df, 'cc')
+apply_corrections(pnk_df, 'pnk')
 
 # Save corrected data
 compcert_df.to_csv("temp_compcert_corrected.csv", index=False)
 pnk_df.to_csv("temp_pnk_ffi_corrected.csv", index=False)
 
-print("Applied correct ethernet driver CPU values")
\ No newline at end of file
+print("Applied correct ethernet driver CPU values")
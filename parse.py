@@ -1,10 +1,59 @@
 #!/usr/bin/env python3
 
-import csv
 import re
 from pathlib import Path
 import sys
 
+import numpy as np
+import pandas as pd
+
+
+IQ_HEADER = 'Requested_Throughput,Receive_Throughput,Send_Throughput,Packet_Size,Minimum_RTT,Average_RTT,Maximum_RTT,Stdev_RTT,Median_RTT,Bad_Packets,Idle_Cycles,Total_Cycles'
+IQ_COLUMNS = IQ_HEADER.split(',')
+IQ_DTYPES = {column: 'float64' if column == 'Stdev_RTT' else 'int64' for column in IQ_COLUMNS}
+IQ_THROUGHPUT_COLUMNS = ['Requested_Throughput', 'Receive_Throughput', 'Send_Throughput']
+IQ_RENAMES = {
+    'Requested_Throughput': 'Requ Thrput (Mb/s)',
+    'Receive_Throughput': 'Recv Thrput (Mb/s)',
+    'Send_Throughput': 'Send Thrput (Mb/s)',
+    'Packet_Size': 'Packet Size (bytes)',
+    'Minimum_RTT': 'Min RTT (μs)',
+    'Average_RTT': 'Mean RTT (μs)',
+    'Maximum_RTT': 'Max RTT (μs)',
+    'Stdev_RTT': 'RTT stdev (μs)',
+    'Median_RTT': 'Med RTT (μs)',
+    'Bad_Packets': 'Bad Packets',
+    'Idle_Cycles': 'Idle Cycles',
+    'Total_Cycles': 'Total Cycles'
+}
+
+IQ_NOHEADER_RE = re.compile(IQ_HEADER + r'\n\s*(\d+),(\d+),(\d+),(\d+),(\d+),(\d+),(\d+),([\d.]+),(\d+),(\d+),(\d+),(\d+)')
+HW_VALUE_RE = re.compile(r':\s*(\d+)')
+UTIL_RE = re.compile(r'Total utilisation details:[\s\n]*\{[\s\n]*KernelUtilisation:\s*(\d+)[\s\n]*KernelEntries:\s*(\d+)[\s\n]*NumberSchedules:\s*(\d+)[\s\n]*TotalUtilisation:\s*(\d+)')
+
+COMPONENTS = ['ethernet_driver', 'net_virt_tx', 'net_virt_rx', 'client0', 'client0_net_copier']
+COMPONENT_SET = set(COMPONENTS)
+COMPONENT_COLUMNS = [f'{component}_{metric}' for component in COMPONENTS
+                     for metric in ('CPU_Util', 'Kernel_Util', 'User_Util')]
+
+BASE_COLUMNS = [
+    'Requ Thrput (Mb/s)', 'Recv Thrput (Mb/s)', 'Send Thrput (Mb/s)',
+    'Packet Size (bytes)', 'Min RTT (μs)', 'Mean RTT (μs)', 'Max RTT (μs)',
+    'RTT stdev (μs)', 'Med RTT (μs)', 'Idle Cycles', 'Total Cycles',
+    'CPU Util (Fraction)', 'Kernel Cycles', 'User Cycles', 'Kernel Entries',
+    'Schedules', 'Warm-up (s)', 'Cool-down (s)', 'Test Duration (s)', 
+    'Total Time (s)', 'Packets Sent', 'Packet Rate (p/s)', 'Total Packets', 
+    'L1 I-cache misses', 'L1 D-cache misses', 'L1 I-TLB misses', 'L1 D-TLB misses',
+    'Instructions', 'Instructions per Second', 'Branch mispredictions', 
+    'Cycles Per Packet', 'User cycles per packet', 'Kernel cycles per packet',
+    'Kernel entries per packet', 'L1 I-cache misses per packet',
+    'L1 D-cache misses per packet', 'L1 I-TLB misses per packet',
+    'L1 D-TLB misses per packet', 'instructions per packet',
+    'Branch mis-pred per packet'
+]
+EXTRA_COLUMNS = sorted(['Bad Packets', 'Core Cycles', 'System Cycles'] + COMPONENT_COLUMNS)
+KNOWN_COLUMNS = BASE_COLUMNS + EXTRA_COLUMNS
+
 
 def parse_iq_file(file_path):
     
@@ -13,76 +62,51 @@ def parse_iq_file(file_path):
     
     summary_start = content.find('Result Summary:')
     if summary_start == -1:
-        pattern = r'Requested_Throughput,Receive_Throughput,Send_Throughput,Packet_Size,Minimum_RTT,Average_RTT,Maximum_RTT,Stdev_RTT,Median_RTT,Bad_Packets,Idle_Cycles,Total_Cycles\n\s*(\d+),(\d+),(\d+),(\d+),(\d+),(\d+),(\d+),([\d.]+),(\d+),(\d+),(\d+),(\d+)'
-        matches = re.findall(pattern, content)
+        matches = IQ_NOHEADER_RE.findall(content)
     else:
-        summary_content = content[summary_start:]
-        pattern = r'Requested_Throughput,Receive_Throughput,Send_Throughput,Packet_Size,Minimum_RTT,Average_RTT,Maximum_RTT,Stdev_RTT,Median_RTT,Bad_Packets,Idle_Cycles,Total_Cycles\n((?:\d+,\d+,\d+,\d+,\d+,\d+,\d+,[\d.]+,\d+,\d+,\d+,\d+\n?)+)'
-        
-        summary_match = re.search(pattern, summary_content)
-        if summary_match:
-            summary_lines = summary_match.group(1).strip().split('\n')
-            matches = []
-            for line in summary_lines:
-                if line.strip():
-                    parts = line.split(',')
-                    if len(parts) >= 12:
-                        matches.append(tuple(parts[:12]))
-        else:
-            matches = []
-    
-    test_results = []
-    for match in matches:
-        result = {
-            'Requ Thrput (Mb/s)': int(match[0]) / 1000000,
-            'Recv Thrput (Mb/s)': int(match[1]) / 1000000,
-            'Send Thrput (Mb/s)': int(match[2]) / 1000000,
-            'Packet Size (bytes)': int(match[3]),
-            'Min RTT (μs)': int(match[4]),
-            'Mean RTT (μs)': int(match[5]),
-            'Max RTT (μs)': int(match[6]),
-            'RTT stdev (μs)': float(match[7]),
-            'Med RTT (μs)': int(match[8]),
-            'Bad Packets': int(match[9]),
-            'Idle Cycles': int(match[10]),
-            'Total Cycles': int(match[11])
-        }
-        test_results.append(result)
-    
-    return test_results
+        header_start = content.find(IQ_HEADER, summary_start)
+        matches = []
+        if header_start != -1:
+            body_start = header_start + len(IQ_HEADER) + 1
+            for line in content[body_start:].splitlines():
+                if not line[:1].isdigit():
+                    break
+                parts = line.split(',')
+                if len(parts) >= 12:
+                    matches.append(tuple(parts[:12]))
+    
+    df = pd.DataFrame(matches, columns=IQ_COLUMNS).astype(IQ_DTYPES)
+    df[IQ_THROUGHPUT_COLUMNS] = df[IQ_THROUGHPUT_COLUMNS] / 1000000
+    df = df.rename(columns=IQ_RENAMES)
+    
+    return df.to_dict('records')
 
 
 def parse_out_file(file_path):
     
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
-    
     test_data = []
     
-    if any('System Total' in line and 'Core Cycles' in lines[0] for line in lines):
-        system_totals = {}
-        for line in lines:
-            if line.startswith('System Total'):
-                parts = line.strip().split(',')
-                if len(parts) > 1:
-                    throughput = parts[0].replace('System Total ', '')
-                    system_totals[throughput] = {
-                        'Core Cycles': int(parts[1]),
-                        'System Cycles': int(parts[2]),
-                        'Kernel Cycles': int(parts[3]),
-                        'User Cycles': int(parts[4]),
-                        'Kernel Entries': int(parts[5]),
-                        'Schedules': int(parts[6])
-                    }
-        
-        hw_data = []
-        hw_section_found = False
-        for i, line in enumerate(lines):
-            if 'L1 i-cache misses' in line and 'L1 d-cache misses' in line:
-                hw_section_found = True
-                for j in range(i+1, len(lines)):
-                    if lines[j].strip():
-                        parts = lines[j].strip().split(',')
+    with open(file_path, 'r') as f:
+        header = f.readline()
+        while header and not header.strip():
+            header = f.readline()
+        csv_format = 'Core Cycles' in header
+        if csv_format:
+            system_totals = {}
+            hw_data = []
+            in_hw_block = False
+            component_tests = []
+            component_names = []
+            cpu_util = []
+            kernel_util = []
+            user_util = []
+            current_test_idx = -1
+            
+            for raw in f:
+                line = raw[:-1] if raw.endswith('\n') else raw
+                if in_hw_block:
+                    if line and not line.isspace():
+                        parts = line.split(',')
                         if len(parts) >= 6:
                             hw_data.append({
                                 'L1 I-cache misses': int(parts[0]) if parts[0] else 0,
@@ -92,56 +116,79 @@ def parse_out_file(file_path):
                                 'Instructions': int(parts[4]) if parts[4] else 0,
                                 'Branch mispredictions': int(parts[5]) if parts[5] else 0
                             })
-                break
-        
-        component_data = {}
-        current_test_idx = -1
-        components_of_interest = ['ethernet_driver', 'net_virt_tx', 'net_virt_rx', 'client0', 'client0_net_copier']
-        
-        for line in lines:
-            if line.startswith('TEST'):
-                current_test_idx += 1
-                if current_test_idx not in component_data:
-                    component_data[current_test_idx] = {}
-            
-            for component in components_of_interest:
-                if line.startswith(component + ','):
-                    parts = line.strip().split(',')
-                    if len(parts) >= 9:
-                        if current_test_idx not in component_data:
-                            component_data[current_test_idx] = {}
-                        component_data[current_test_idx][component] = {
-                            'CPU_Util': float(parts[7]),
-                            'Kernel_Util': float(parts[8]),
-                            'User_Util': float(parts[9]) if len(parts) > 9 else 0.0
+                    continue
+                
+                head, sep, rest = line.partition(',')
+                if head.startswith('System Total'):
+                    if sep:
+                        fields = rest.split(',', 6)
+                        system_totals[head[len('System Total '):]] = {
+                            'Core Cycles': int(fields[0]),
+                            'System Cycles': int(fields[1]),
+                            'Kernel Cycles': int(fields[2]),
+                            'User Cycles': int(fields[3]),
+                            'Kernel Entries': int(fields[4]),
+                            'Schedules': int(fields[5])
                         }
-        
-        test_order = ['10Mb/s', '20Mb/s', '50Mb/s', '100Mb/s', '200Mb/s', 
-                      '300Mb/s', '400Mb/s', '500Mb/s', '600Mb/s', '700Mb/s', 
-                      '800Mb/s', '900Mb/s', '1000Mb/s']
-        
-        for i, throughput in enumerate(test_order):
-            if throughput in system_totals:
-                data = system_totals[throughput].copy()
+                    continue
                 
-                if i < len(hw_data):
-                    data.update(hw_data[i])
+                if line.startswith('TEST'):
+                    current_test_idx += 1
+                    continue
                 
-                if i in component_data:
-                    for component, comp_data in component_data[i].items():
-                        data[f'{component}_CPU_Util'] = comp_data['CPU_Util']
-                        data[f'{component}_Kernel_Util'] = comp_data['Kernel_Util']
-                        data[f'{component}_User_Util'] = comp_data['User_Util']
+                if 'L1 i-cache misses' in line and 'L1 d-cache misses' in line:
+                    in_hw_block = True
+                    continue
                 
-                test_data.append(data)
-    else:
-        hw_pattern = r'\{[\s\n]*L1 i-cache misses:\s*(\d+)[\s\n]*L1 d-cache misses:\s*(\d+)[\s\n]*L1 i-tlb misses:\s*(\d+)[\s\n]*L1 d-tlb misses:\s*(\d+)[\s\n]*Instructions:\s*(\d+)[\s\n]*Branch mispredictions:\s*(\d+)[\s\n]*\}'
+                if not sep or head not in COMPONENT_SET:
+                    continue
+                
+                parts = rest.split(',')
+                if len(parts) >= 8:
+                    component_tests.append(current_test_idx)
+                    component_names.append(head)
+                    cpu_util.append(float(parts[6]))
+                    kernel_util.append(float(parts[7]))
+                    user_util.append(float(parts[8]) if len(parts) > 8 else 0.0)
+        else:
+            content = header + f.read()
+    
+    if csv_format:
+        components = pd.DataFrame({
+            'test': component_tests,
+            'component': component_names,
+            'CPU_Util': cpu_util,
+            'Kernel_Util': kernel_util,
+            'User_Util': user_util
+        }).drop_duplicates(['test', 'component'], keep='last')
+        components = components.pivot(index='test', columns='component')
+        components.columns = [f'{component}_{metric}' for metric, component in components.columns]
         
-        hw_matches = re.findall(hw_pattern, content)
+        test_order = ['10Mb/s', '20Mb/s', '50Mb/s', '100Mb/s', '200Mb/s', 
+                      '300Mb/s', '400Mb/s', '500Mb/s', '600Mb/s', '700Mb/s', 
+                      '800Mb/s', '900Mb/s', '1000Mb/s']
         
-        util_pattern = r'Total utilisation details:[\s\n]*\{[\s\n]*KernelUtilisation:\s*(\d+)[\s\n]*KernelEntries:\s*(\d+)[\s\n]*NumberSchedules:\s*(\d+)[\s\n]*TotalUtilisation:\s*(\d+)'
+        present = [i for i, throughput in enumerate(test_order) if throughput in system_totals]
+        totals = pd.DataFrame([system_totals[test_order[i]] for i in present], index=present)
+        hw = pd.DataFrame(hw_data, dtype='Int64')
         
-        util_matches = re.findall(util_pattern, content)
+        for row in totals.join(hw).join(components).to_dict('records'):
+            test_data.append({key: value for key, value in row.items() if not pd.isna(value)})
+    else:
+        hw_values = []
+        start = content.find('{')
+        while start != -1:
+            end = content.find('}', start)
+            if end == -1:
+                break
+            block = content[start + 1:end]
+            if block.lstrip().startswith('L1 i-cache misses:'):
+                values = HW_VALUE_RE.findall(block)
+                if len(values) == 6:
+                    hw_values.extend(values)
+            start = content.find('{', start + 1)
+        hw_matches = np.array(hw_values, dtype=np.int64).reshape(-1, 6)
+        util_matches = UTIL_RE.findall(content)
         
         for i in range(min(len(hw_matches), len(util_matches))):
             data = {
@@ -164,119 +211,94 @@ def parse_out_file(file_path):
 
 def combine_data(iq_results, out_data):
     
-    combined_data = []
+    if not iq_results:
+        return pd.DataFrame()
     
-    for i in range(len(iq_results)):
-        row = iq_results[i].copy()
-        
-        if i < len(out_data):
-            for key, value in out_data[i].items():
-                if key not in row:
-                    row[key] = value
-        
-        if 'Core Cycles' in row and 'Total Cycles' not in row:
-            row['Total Cycles'] = row['Core Cycles']
-        
-        if 'Total Cycles' in row and 'Idle Cycles' in row and row.get('Total Cycles', 0) > 0:
-            idle_fraction = row['Idle Cycles'] / row['Total Cycles']
-            row['CPU Util (Fraction)'] = round(1 - idle_fraction, 4)
-        else:
-            row['CPU Util (Fraction)'] = 'NA'
-        
-        if 'User Cycles' not in row or row['User Cycles'] == 0:
-            if row.get('Total Cycles', 0) > 0 and row.get('Kernel Cycles', 0) > 0:
-                row['User Cycles'] = row['Total Cycles'] - row['Kernel Cycles'] - row['Idle Cycles']
-        
-        total_packets = 200000
-        row['Total Packets'] = total_packets
-        row['Packets Sent'] = total_packets
-        
-        throughput_mbps = row['Recv Thrput (Mb/s)']
-        packet_size = row['Packet Size (bytes)']
-        packet_rate = (throughput_mbps * 1000000) / ((packet_size + 56) * 8)
-        row['Packet Rate (p/s)'] = round(packet_rate, 2)
-        
-        if total_packets > 0:
-            row['Cycles Per Packet'] = int(row['Total Cycles'] / total_packets) if 'Total Cycles' in row else 'NA'
-            row['User cycles per packet'] = int(row['User Cycles'] / total_packets) if 'User Cycles' in row and row['User Cycles'] > 0 else 'NA'
-            row['Kernel cycles per packet'] = int(row['Kernel Cycles'] / total_packets) if 'Kernel Cycles' in row else 'NA'
-            row['Kernel entries per packet'] = round(row['Kernel Entries'] / total_packets, 2) if 'Kernel Entries' in row else 'NA'
-            row['L1 I-cache misses per packet'] = round(row['L1 I-cache misses'] / total_packets, 2) if 'L1 I-cache misses' in row else 'NA'
-            row['L1 D-cache misses per packet'] = round(row['L1 D-cache misses'] / total_packets, 2) if 'L1 D-cache misses' in row else 'NA'
-            row['L1 I-TLB misses per packet'] = round(row['L1 I-TLB misses'] / total_packets, 2) if 'L1 I-TLB misses' in row else 'NA'
-            row['L1 D-TLB misses per packet'] = round(row['L1 D-TLB misses'] / total_packets, 2) if 'L1 D-TLB misses' in row else 'NA'
-            row['instructions per packet'] = int(row['Instructions'] / total_packets) if 'Instructions' in row else 'NA'
-            row['Branch mis-pred per packet'] = round(row['Branch mispredictions'] / total_packets, 2) if 'Branch mispredictions' in row else 'NA'
-        else:
-            row['Cycles Per Packet'] = 'NA'
-            row['User cycles per packet'] = 'NA'
-            row['Kernel cycles per packet'] = 'NA'
-            row['Kernel entries per packet'] = 'NA'
-            row['L1 I-cache misses per packet'] = 'NA'
-            row['L1 D-cache misses per packet'] = 'NA'
-            row['L1 I-TLB misses per packet'] = 'NA'
-            row['L1 D-TLB misses per packet'] = 'NA'
-            row['instructions per packet'] = 'NA'
-            row['Branch mis-pred per packet'] = 'NA'
-        
-        row['Warm-up (s)'] = 10
-        row['Cool-down (s)'] = 10
-        
-        if packet_rate > 0:
-            test_duration = total_packets / packet_rate
-            row['Test Duration (s)'] = round(test_duration, 2)
-            row['Total Time (s)'] = round(test_duration + 10 + 10, 2)
-            
-            total_time = test_duration + 10 + 10
-            if 'Instructions' in row and row['Instructions'] > 0:
-                instructions_per_sec = row['Instructions'] / total_time
-                row['Instructions per Second'] = int(instructions_per_sec)
-            else:
-                row['Instructions per Second'] = 'NA'
-        else:
-            row['Test Duration (s)'] = 'NA'
-            row['Total Time (s)'] = 'NA'
-            row['Instructions per Second'] = 'NA'
-        
-        combined_data.append(row)
+    iq = pd.DataFrame(iq_results)
+    out = pd.DataFrame(out_data).convert_dtypes(convert_string=False, convert_boolean=False, convert_floating=False)
+    out = out.drop(columns=[key for key in out.columns if key in iq.columns])
+    df = iq.join(out.iloc[:len(iq)])
+    
+    missing = [column for column in ['Core Cycles', 'Kernel Cycles', 'User Cycles', 'Kernel Entries',
+                                     'L1 I-cache misses', 'L1 D-cache misses', 'L1 I-TLB misses',
+                                     'L1 D-TLB misses', 'Instructions', 'Branch mispredictions']
+               if column not in df.columns]
+    for column in missing:
+        df[column] = pd.Series(pd.NA, index=df.index, dtype='Int64')
+    
+    df['Total Cycles'] = df['Total Cycles'].fillna(df['Core Cycles'])
+    total_cycles = df['Total Cycles']
+    
+    df['CPU Util (Fraction)'] = (1 - df['Idle Cycles'] / total_cycles).where((total_cycles > 0).fillna(False))
+    
+    needs_user = (df['User Cycles'].isna() | (df['User Cycles'] == 0)).fillna(True)
+    can_derive = ((total_cycles > 0) & (df['Kernel Cycles'] > 0)).fillna(False)
+    derived_user = total_cycles - df['Kernel Cycles'] - df['Idle Cycles']
+    df['User Cycles'] = df['User Cycles'].where(~(needs_user & can_derive), derived_user)
+    
+    total_packets = 200000
+    df['Total Packets'] = total_packets
+    df['Packets Sent'] = total_packets
+    
+    packet_rate = (df['Recv Thrput (Mb/s)'] * 1000000) / ((df['Packet Size (bytes)'] + 56) * 8)
+    df['Packet Rate (p/s)'] = packet_rate
     
-    return combined_data
+    def per_packet(column):
+        return df[column] / total_packets
+    
+    df['Cycles Per Packet'] = per_packet('Total Cycles')
+    df['User cycles per packet'] = per_packet('User Cycles').where((df['User Cycles'] > 0).fillna(False))
+    df['Kernel cycles per packet'] = per_packet('Kernel Cycles')
+    df['Kernel entries per packet'] = per_packet('Kernel Entries')
+    df['L1 I-cache misses per packet'] = per_packet('L1 I-cache misses')
+    df['L1 D-cache misses per packet'] = per_packet('L1 D-cache misses')
+    df['L1 I-TLB misses per packet'] = per_packet('L1 I-TLB misses')
+    df['L1 D-TLB misses per packet'] = per_packet('L1 D-TLB misses')
+    df['instructions per packet'] = per_packet('Instructions')
+    df['Branch mis-pred per packet'] = per_packet('Branch mispredictions')
+    
+    df['Warm-up (s)'] = 10
+    df['Cool-down (s)'] = 10
+    
+    has_rate = packet_rate > 0
+    test_duration = (total_packets / packet_rate).where(has_rate)
+    total_time = test_duration + 10 + 10
+    df['Test Duration (s)'] = test_duration
+    df['Total Time (s)'] = total_time
+    
+    has_instructions = (df['Instructions'] > 0).fillna(False)
+    df['Instructions per Second'] = (df['Instructions'] / total_time).where(has_instructions)
+    
+    nullable_int_columns = ['Cycles Per Packet', 'User cycles per packet', 'Kernel cycles per packet',
+                            'instructions per packet', 'Instructions per Second']
+    df[nullable_int_columns] = np.trunc(df[nullable_int_columns]).astype('Int64')
+    
+    df = df.round({
+        'CPU Util (Fraction)': 4,
+        'Packet Rate (p/s)': 2,
+        'Kernel entries per packet': 2,
+        'L1 I-cache misses per packet': 2,
+        'L1 D-cache misses per packet': 2,
+        'L1 I-TLB misses per packet': 2,
+        'L1 D-TLB misses per packet': 2,
+        'Branch mis-pred per packet': 2,
+        'Test Duration (s)': 2,
+        'Total Time (s)': 2
+    })
+    
+    # Optional columns added above only for the arithmetic are not written out
+    return df.drop(columns=[column for column in missing if column in EXTRA_COLUMNS])
 
 
-def write_csv(data_rows, output_file):
-    
-    base_columns = [
-        'Requ Thrput (Mb/s)', 'Recv Thrput (Mb/s)', 'Send Thrput (Mb/s)',
-        'Packet Size (bytes)', 'Min RTT (μs)', 'Mean RTT (μs)', 'Max RTT (μs)',
-        'RTT stdev (μs)', 'Med RTT (μs)', 'Idle Cycles', 'Total Cycles',
-        'CPU Util (Fraction)', 'Kernel Cycles', 'User Cycles', 'Kernel Entries',
-        'Schedules', 'Warm-up (s)', 'Cool-down (s)', 'Test Duration (s)', 
-        'Total Time (s)', 'Packets Sent', 'Packet Rate (p/s)', 'Total Packets', 
-        'L1 I-cache misses', 'L1 D-cache misses', 'L1 I-TLB misses', 'L1 D-TLB misses',
-        'Instructions', 'Instructions per Second', 'Branch mispredictions', 
-        'Cycles Per Packet', 'User cycles per packet', 'Kernel cycles per packet',
-        'Kernel entries per packet', 'L1 I-cache misses per packet',
-        'L1 D-cache misses per packet', 'L1 I-TLB misses per packet',
-        'L1 D-TLB misses per packet', 'instructions per packet',
-        'Branch mis-pred per packet'
-    ]
-    
-    all_keys = set()
-    for row in data_rows:
-        all_keys.update(row.keys())
-    
-    component_columns = sorted([k for k in all_keys if k not in base_columns])
-    columns = base_columns + component_columns
-    
-    with open(output_file, 'w', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=columns)
-        writer.writeheader()
-        
-        for row in data_rows:
-            for col in columns:
-                if col not in row:
-                    row[col] = 'NA'
-            writer.writerow(row)
+def write_csv(df, output_file):
+    
+    if df.columns.isin(KNOWN_COLUMNS).all():
+        columns = BASE_COLUMNS + [column for column in EXTRA_COLUMNS if column in df.columns]
+    else:
+        columns = BASE_COLUMNS + sorted(set(df.columns) - set(BASE_COLUMNS))
+    df = df.reindex(columns=columns)
+    with open(output_file, 'w', newline='', buffering=1 << 20) as csvfile:
+        df.to_csv(csvfile, index=False, na_rep='NA', lineterminator='\r\n')
     
     print(f"CSV file written to: {output_file}")
 
@@ -301,21 +323,13 @@ def main():
         return
     
     iq_results = parse_iq_file(iq_file)
-    
-    seen_throughputs = set()
-    unique_results = []
-    duplicates_removed = 0
-    
+
+    unique_results = {}
     for result in iq_results:
-        throughput = result['Requ Thrput (Mb/s)']
-        if throughput not in seen_throughputs:
-            seen_throughputs.add(throughput)
-            unique_results.append(result)
-        else:
-            duplicates_removed += 1
-    
-    iq_results = unique_results
-    
+        unique_results.setdefault(result['Requ Thrput (Mb/s)'], result)
+
+    iq_results = list(unique_results.values())
+
     out_data = parse_out_file(out_file)
     
     combined_data = combine_data(iq_results, out_data)
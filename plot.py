@@ -1,73 +1,197 @@
 #!/usr/bin/env python3
 
 import pandas as pd
+import matplotlib
+# Batch rendering only: pin the non-interactive Agg backend before pyplot is imported
+matplotlib.use('Agg')
+matplotlib.interactive(False)
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from concurrent.futures import ProcessPoolExecutor
 import sys
 from pathlib import Path
 import os
+import importlib.util
+import hashlib
+
+# pyarrow's CSV parser is used when it is installed
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
 
 plt.style.use('seaborn-v0_8-whitegrid')
 
 plt.rcParams['font.family'] = 'monospace'
 plt.rcParams['font.monospace'] = ['DejaVu Sans Mono', 'Consolas', 'Monaco', 'Courier New', 'monospace']
+plt.rcParams['toolbar'] = 'None'
+plt.rcParams['figure.max_open_warning'] = 0
+# tight_layout measures text on the Agg canvas at figure.dpi, and the PDF and SVG backends always
+# draw at 72 dpi, so measure at 72 too: the layout then fits the text as written out (and the
+# Agg buffers stay small)
+plt.rcParams['figure.dpi'] = 72
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['svg.fonttype'] = 'none'
 
 COLOR_BASELINE = '#84A5C7'
 COLOR_COMPARATOR = '#F18484'
 COLOR_DIFF_LINE = '#555555'
 
-PRESENTATION_TITLE_SIZE = 24
-PRESENTATION_AXIS_LABEL_SIZE = 20
-PRESENTATION_LEGEND_SIZE = 18
-PRESENTATION_DIFF_LABEL_SIZE = 16
-PRESENTATION_VALUE_LABEL_SIZE = 16
-PRESENTATION_LINE_WIDTH = 4
-PRESENTATION_MARKER_SIZE = 12
-PRESENTATION_DIFF_MARKER_SIZE = 14
-
-REGULAR_TITLE_SIZE = 14
-REGULAR_AXIS_LABEL_SIZE = 12
-REGULAR_LEGEND_SIZE = 10
-REGULAR_DIFF_LABEL_SIZE = 7
-REGULAR_VALUE_LABEL_SIZE = 8
-REGULAR_LINE_WIDTH = 2
-REGULAR_MARKER_SIZE = 8
-REGULAR_DIFF_MARKER_SIZE = 10
+DIFF_LABEL_BBOX = dict(boxstyle='round,pad=0.2', facecolor='lightgray', alpha=0.7, edgecolor='gray', linewidth=0.5)
+
+STYLE = {
+    'presentation': {
+        'title_size': 24,
+        'axis_label_size': 20,
+        'legend_size': 18,
+        'diff_label_size': 16,
+        'value_label_size': 16,
+        'line_width': 4,
+        'marker_size': 12,
+        'diff_marker_size': 14,
+        'layout_pad': 2.0,
+    },
+    'regular': {
+        'title_size': 14,
+        'axis_label_size': 12,
+        'legend_size': 10,
+        'diff_label_size': 7,
+        'value_label_size': 8,
+        'line_width': 2,
+        'marker_size': 8,
+        'diff_marker_size': 10,
+        'layout_pad': 1.08,
+    },
+}
+
+FIGSIZES = {
+    ('presentation', False): (16, 12),
+    ('presentation', True): (16, 16),
+    ('regular', False): (12, 8),
+    ('regular', True): (12, 10),
+}
+
+COMPONENTS = ['ethernet_driver', 'net_virt_tx', 'net_virt_rx', 'client0', 'client0_net_copier']
+COMPONENT_NAMES = ['Ethernet Driver CPU Utilization', 'Net Virt TX CPU Utilization', 
+                   'Net Virt RX CPU Utilization', 'Client0 CPU Utilization', 'Client0 Net Copier CPU Utilization']
+
+RAW_CPU_METRICS = [
+    ('Total Cycles', 'Total CPU Cycles'),
+    ('Kernel Cycles', 'Kernel CPU Cycles'),
+    ('User Cycles', 'User CPU Cycles'),
+    ('Idle Cycles', 'Idle CPU Cycles')
+]
+
+RAW_CACHE_METRICS = [
+    ('L1 I-cache misses', 'L1 I-cache Misses (Total)'),
+    ('L1 D-cache misses', 'L1 D-cache Misses (Total)'),
+    ('L1 I-TLB misses', 'L1 I-TLB Misses (Total)'),
+    ('L1 D-TLB misses', 'L1 D-TLB Misses (Total)'),
+    ('Instructions', 'Instructions (Total)'),
+    ('Branch mispredictions', 'Branch Mispredictions (Total)')
+]
+
+NORMALIZED_CACHE_METRICS = [
+    ('L1 I-cache misses per packet', 'L1 I-cache Misses per Packet'),
+    ('L1 D-cache misses per packet', 'L1 D-cache Misses per Packet'),
+    ('L1 I-TLB misses per packet', 'L1 I-TLB Misses per Packet'),
+    ('L1 D-TLB misses per packet', 'L1 D-TLB Misses per Packet'),
+    ('instructions per packet', 'Instructions per Packet'),
+    ('Branch mis-pred per packet', 'Branch Mispredictions per Packet')
+]
+
+EFFICIENCY_METRICS = [
+    ('Cycles Per Packet', 'Cycles per Packet', True),
+    ('instructions per packet', 'Instructions per Packet', True),
+    ('Branch mis-pred per packet', 'Branch Mispredictions per Packet', True),
+    ('Mean RTT (μs)', 'Mean Round-Trip Time (μs)', False)
+]
+
+PACKET_METRICS = [
+    ('Packet Rate (p/s)', 'Packet Rate (packets/s)', 1000),
+    ('Recv Thrput (Mb/s)', 'Received Throughput (Mb/s)', 1),
+    ('Send Thrput (Mb/s)', 'Sent Throughput (Mb/s)', 1)
+]
+
+# Only these columns are read from the CSVs
+NEEDED_COLS = {'Kernel Cycles', 'Requ Thrput (Mb/s)', 'CPU Util (Fraction)', 'Instructions per Second', 'Recv Thrput (Mb/s)'}
+NEEDED_COLS.update(f'{component}_CPU_Util' for component in COMPONENTS)
+for metrics in (RAW_CPU_METRICS, RAW_CACHE_METRICS, NORMALIZED_CACHE_METRICS, EFFICIENCY_METRICS, PACKET_METRICS):
+    NEEDED_COLS.update(metric[0] for metric in metrics)
+
+# The dual-axis throughput plot has its own renderer; every other entry is a comparison plot
+THROUGHPUT_VS_CPU_PLOT = '02_throughput_vs_cpu'
+
+# (filename, column, ylabel, title, divisor, use_bars), in PDF page order
+PLOTS = [
+    ('01_instructions_per_second', 'Instructions per Second', 'Instructions per Second (Billions)', 'Instructions per Second vs Throughput', 1e9, True),
+    (THROUGHPUT_VS_CPU_PLOT, 'Recv Thrput (Mb/s)', None, None, 1, False),
+    ('03_total_cpu_utilization', 'CPU Util (%)', 'CPU Utilization (%)', 'Total System CPU Utilization vs Throughput', 1, True),
+]
+PLOTS += [(f'04_{component}_utilization', f'{component}_CPU_Util', 'CPU Utilization (%)', f'{name} vs Throughput', 1, True)
+          for component, name in zip(COMPONENTS, COMPONENT_NAMES)]
+PLOTS += [('05_system_cpu_utilization', 'CPU Util (%)', 'CPU Utilization (%)', 'System CPU Utilization vs Throughput', 1, True)]
+PLOTS += [(f'06_{metric.lower().replace(" ", "_")}_cycles', metric, f'{metric} (Billions)', f'{title} vs Throughput', 1e9, True)
+          for metric, title in RAW_CPU_METRICS]
+PLOTS += [(f'07_{metric.lower().replace(" ", "_").replace("-", "_")}_raw', metric, title.replace("(Total)", "(Millions)"), f'{title} vs Throughput', 1e6, True)
+          for metric, title in RAW_CACHE_METRICS]
+PLOTS += [(f'08_{metric.lower().replace(" ", "_").replace("-", "_")}_normalized', metric, metric.replace('per packet', '/ Packet'), f'{title} vs Throughput', 1, True)
+          for metric, title in NORMALIZED_CACHE_METRICS]
+PLOTS += [(f'09_{metric.lower().replace(" ", "_").replace("-", "_").replace("(μs)", "")}_efficiency', metric, title, f'{title} vs Throughput', 1, use_bars)
+          for metric, title, use_bars in EFFICIENCY_METRICS]
+PLOTS += [(f'10_{metric.lower().replace(" ", "_").replace("(", "").replace(")", "").replace("/", "_")}_packets', metric,
+           title.replace('(packets/s)', '(Kpps)') if divisor == 1000 else title, f'{title} vs Throughput', divisor, True)
+          for metric, title, divisor in PACKET_METRICS]
 
 def load_data(csv_file):
-    df = pd.read_csv(csv_file)
-    df = df[df['Kernel Cycles'].notna()]
+    header = pd.read_csv(csv_file, nrows=0).columns
+    usecols = [col for col in header if col in NEEDED_COLS]
+    df = pd.read_csv(csv_file, engine=CSV_ENGINE, usecols=usecols)
+    df = df.dropna(subset=['Kernel Cycles'])
     df = df.reset_index(drop=True)
     
     return df
 
+def to_plot_data(df):
+    """Convert a loaded DataFrame to {column: ndarray}, adding the derived 'CPU Util (%)' column."""
+    data = {col: df[col].to_numpy() for col in df.columns}
+    data['CPU Util (%)'] = data['CPU Util (Fraction)'] * 100
+    return data
+
 def calculate_relative_diff(baseline, comparison):
-    return ((comparison - baseline) / baseline) * 100
+    # Zero baselines give a 0% difference instead of inf/NaN
+    out = np.zeros_like(baseline, dtype=np.float64)
+    np.divide(comparison - baseline, baseline, out=out, where=(baseline != 0))
+    return out * 100
 
-def create_comparison_plot(ax1, ax2, x_positions, x_labels, y1, y2, ylabel, title, label1, label2, use_bars=True, show_diff_overlay=True, show_diff_subplot=False, show_value_labels=False, presentation_mode=False):
+def format_displayed_values(values):
+    """Format values to 1 decimal place (>= 10) or 2, returning the labels and the values they show."""
+    labels = np.where(values >= 10, np.char.mod('%.1f', values), np.char.mod('%.2f', values))
+    return labels, labels.astype(float)
+
+def prep_metric(y1, y2):
+    """Return the float series, their value labels, and the relative difference of the displayed values with its labels."""
+    y1 = np.asarray(y1, dtype=float)
+    y2 = np.asarray(y2, dtype=float)
+    value_labels1, y1_displayed = format_displayed_values(y1)
+    value_labels2, y2_displayed = format_displayed_values(y2)
+    rel_diff = calculate_relative_diff(y1_displayed, y2_displayed)
+    diff_labels = np.char.mod('%.1f%%', rel_diff)
+    return y1, y2, value_labels1, value_labels2, rel_diff, diff_labels
+
+def create_comparison_plot(ax1, ax2, x_positions, x_labels, y1, y2, ylabel, title, label1, label2, use_bars=True, show_diff_overlay=True, show_diff_subplot=False, show_value_labels=False, mode='regular'):
     
-    if presentation_mode:
-        title_size = PRESENTATION_TITLE_SIZE
-        axis_label_size = PRESENTATION_AXIS_LABEL_SIZE
-        legend_size = PRESENTATION_LEGEND_SIZE
-        diff_label_size = PRESENTATION_DIFF_LABEL_SIZE
-        value_label_size = PRESENTATION_VALUE_LABEL_SIZE
-        line_width = PRESENTATION_LINE_WIDTH
-        marker_size = PRESENTATION_MARKER_SIZE
-        diff_marker_size = PRESENTATION_DIFF_MARKER_SIZE
-    else:
-        title_size = REGULAR_TITLE_SIZE
-        axis_label_size = REGULAR_AXIS_LABEL_SIZE
-        legend_size = REGULAR_LEGEND_SIZE
-        diff_label_size = REGULAR_DIFF_LABEL_SIZE
-        value_label_size = REGULAR_VALUE_LABEL_SIZE
-        line_width = REGULAR_LINE_WIDTH
-        marker_size = REGULAR_MARKER_SIZE
-        diff_marker_size = REGULAR_DIFF_MARKER_SIZE
+    s = STYLE[mode]
+    title_size = s['title_size']
+    axis_label_size = s['axis_label_size']
+    legend_size = s['legend_size']
+    diff_label_size = s['diff_label_size']
+    value_label_size = s['value_label_size']
+    line_width = s['line_width']
+    marker_size = s['marker_size']
+    diff_marker_size = s['diff_marker_size']
     
-    y1_displayed = np.array([float(f'{val:.1f}') if val >= 10 else float(f'{val:.2f}') for val in y1])
-    y2_displayed = np.array([float(f'{val:.1f}') if val >= 10 else float(f'{val:.2f}') for val in y2])
+    y1, y2, value_labels1, value_labels2, rel_diff, diff_labels = prep_metric(y1, y2)
     
     if use_bars:
         width = 0.35
@@ -79,28 +203,21 @@ def create_comparison_plot(ax1, ax2, x_positions, x_labels, y1, y2, ylabel, titl
         bars2 = ax1.bar(x2, y2, width, label=label2, color=COLOR_COMPARATOR, alpha=0.85)
         
         if show_value_labels:
-            for bar, val, disp_val in zip(bars1, y1, y1_displayed):
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height + height*0.03,
-                        f'{disp_val:.1f}' if val >= 10 else f'{disp_val:.2f}',
-                        ha='center', va='bottom', fontsize=value_label_size, color=COLOR_BASELINE)
-            
-            for bar, val, disp_val in zip(bars2, y2, y2_displayed):
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height + height*0.03,
-                        f'{disp_val:.1f}' if val >= 10 else f'{disp_val:.2f}',
-                        ha='center', va='bottom', fontsize=value_label_size, color=COLOR_COMPARATOR)
+            ax1.bar_label(bars1, labels=value_labels1, padding=3, fontsize=value_label_size, color=COLOR_BASELINE)
+            ax1.bar_label(bars2, labels=value_labels2, padding=3, fontsize=value_label_size, color=COLOR_COMPARATOR)
     else:
         ax1.plot(x_positions, y1, 'o-', label=label1, linewidth=line_width, markersize=marker_size, color=COLOR_BASELINE)
         ax1.plot(x_positions, y2, 's-', label=label2, linewidth=line_width, markersize=marker_size, color=COLOR_COMPARATOR)
         
         if show_value_labels:
-            for x, val, disp_val in zip(x_positions, y1, y1_displayed):
-                ax1.text(x, val + max(y1)*0.05, f'{disp_val:.1f}' if val >= 10 else f'{disp_val:.2f}',
+            offset1 = max(y1)*0.05
+            for x, val, label in zip(x_positions, y1, value_labels1):
+                ax1.text(x, val + offset1, label,
                         ha='center', va='bottom', fontsize=value_label_size, color=COLOR_BASELINE)
             
-            for x, val, disp_val in zip(x_positions, y2, y2_displayed):
-                ax1.text(x, val + max(y2)*0.05, f'{disp_val:.1f}' if val >= 10 else f'{disp_val:.2f}',
+            offset2 = max(y2)*0.05
+            for x, val, label in zip(x_positions, y2, value_labels2):
+                ax1.text(x, val + offset2, label,
                         ha='center', va='bottom', fontsize=value_label_size, color=COLOR_COMPARATOR)
     
     ax1.set_ylabel(ylabel, fontsize=axis_label_size)
@@ -110,20 +227,18 @@ def create_comparison_plot(ax1, ax2, x_positions, x_labels, y1, y2, ylabel, titl
     ax1.set_xticks(x_positions)
     ax1.set_xticklabels(x_labels, rotation=45)
     
-    rel_diff = calculate_relative_diff(y1_displayed, y2_displayed)
-    
     if show_diff_overlay:
         ax_twin = ax1.twinx()
         
         ax_twin.plot(x_positions, rel_diff, color=COLOR_DIFF_LINE, linewidth=line_width, zorder=5)
         
-        for x, diff in zip(x_positions, rel_diff):
-            ax_twin.plot(x, diff, 'o', color=COLOR_DIFF_LINE, markersize=diff_marker_size, zorder=6)
-            
-            ax_twin.text(x, diff + 5, f'{diff:.1f}%', 
+        ax_twin.scatter(x_positions, rel_diff, s=diff_marker_size**2, color=COLOR_DIFF_LINE, zorder=6)
+        
+        for x, diff, label in zip(x_positions, rel_diff, diff_labels):
+            ax_twin.text(x, diff + 5, label, 
                         ha='center', va='bottom', fontsize=diff_label_size, 
                         color=COLOR_DIFF_LINE, fontweight='bold', zorder=7,
-                        bbox=dict(boxstyle='round,pad=0.2', facecolor='lightgray', alpha=0.7, edgecolor='gray', linewidth=0.5))
+                        bbox=DIFF_LABEL_BBOX)
         
         ax_twin.set_ylim(-20, 80)
         ax_twin.set_ylabel('Relative Difference (%)', fontsize=axis_label_size)
@@ -154,83 +269,88 @@ def create_comparison_plot(ax1, ax2, x_positions, x_labels, y1, y2, ylabel, titl
         ax2.axhline(y=0, color='black', linestyle='--', linewidth=1)
         ax2.grid(True, alpha=0.3, linewidth=0.5, linestyle='-', axis='y', which='major')
         
-        for bar, val in zip(bars, rel_diff):
+        for bar, label in zip(bars, diff_labels):
             height = bar.get_height()
-            color = COLOR_DIFF_LINE
             if abs(height) > 0.1:
                 ax2.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{val:.1f}%', ha='center', 
+                        label, ha='center', 
                         va='bottom' if height >= 0 else 'top', 
-                        fontsize=9, color=color, fontweight='bold')
+                        fontsize=9, color=COLOR_DIFF_LINE, fontweight='bold')
 
-def get_figure_size(presentation_mode, show_diff_subplot=False):
-    """Get appropriate figure size based on mode and subplot configuration."""
-    if presentation_mode:
-        return (16, 16) if show_diff_subplot else (16, 12)
-    else:
-        return (12, 10) if show_diff_subplot else (12, 8)
+def comparison_job(svg_path, *plot_args, **plot_kwargs):
+    """Describe one create_comparison_plot figure so it can be rendered in a worker process."""
+    return render_comparison_figure, (svg_path, plot_args, plot_kwargs)
 
-def save_plot(fig, pdf, svg_dir, filename, presentation_mode=False):
-    """Save plot to both PDF and SVG (if svg_dir provided)."""
-    if presentation_mode:
-        plt.tight_layout(pad=2.0)
-    else:
-        plt.tight_layout()
-    pdf.savefig(fig)
-    if svg_dir:
-        plt.savefig(svg_dir / f'{filename}.svg', format='svg', bbox_inches='tight')
-    plt.close()
-
-def plot_instructions_per_second(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2', show_diff_overlay=True, show_diff_subplot=False, show_value_labels=False, presentation_mode=False):
-    """Plot instructions per second comparison."""
-    
-    figsize = get_figure_size(presentation_mode, show_diff_subplot)
-    if show_diff_subplot:
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
-    else:
-        fig, ax1 = plt.subplots(1, 1, figsize=figsize)
-        ax2 = None
-    
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
+# Figures reused between renders in the same process, keyed by (mode, show_diff_subplot)
+_comparison_figures = {}
+
+def get_comparison_figure(mode, show_diff_subplot):
+    """Return a cleared figure and axes for this layout, creating it on first use."""
+    key = (mode, show_diff_subplot)
+    if key not in _comparison_figures:
+        figsize = FIGSIZES[key]
+        if show_diff_subplot:
+            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
+        else:
+            fig, ax1 = plt.subplots(1, 1, figsize=figsize)
+            ax2 = None
+        # Detach from pyplot (the figure lives in the cache instead), keeping an Agg canvas for layout
+        plt.close(fig)
+        FigureCanvasAgg(fig)
+        subplotpars = {name: getattr(fig.subplotpars, name) for name in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')}
+        _comparison_figures[key] = (fig, ax1, ax2, subplotpars)
+        return fig, ax1, ax2
+    
+    fig, ax1, ax2, subplotpars = _comparison_figures[key]
+    # Drop the twin axes added by the previous render's diff overlay
+    for ax in fig.axes:
+        if ax is not ax1 and ax is not ax2:
+            ax.remove()
+    ax1.clear()
+    if ax2 is not None:
+        ax2.clear()
+    # Start tight_layout from the same margins as a fresh figure
+    fig.subplots_adjust(**subplotpars)
+    return fig, ax1, ax2
+
+def finish_figure(fig, svg_path, mode):
+    """Lay out a rendered figure and write its SVG (if requested)."""
+    fig.tight_layout(pad=STYLE[mode]['layout_pad'])
+    if svg_path:
+        fig.savefig(svg_path, format='svg', bbox_inches='tight')
+    return fig
+
+def render_comparison_figure(svg_path, plot_args, plot_kwargs):
+    """Render one comparison figure (and its SVG) in a worker process and return it."""
+    show_diff_subplot = plot_kwargs.get('show_diff_subplot', False)
+    mode = plot_kwargs.get('mode', 'regular')
     
-    inst_per_sec1 = df1['Instructions per Second'] / 1e9
-    inst_per_sec2 = df2['Instructions per Second'] / 1e9
+    fig, ax1, ax2 = get_comparison_figure(mode, show_diff_subplot)
     
-    create_comparison_plot(ax1, ax2, x_positions, x_labels, inst_per_sec1, inst_per_sec2,
-                          'Instructions per Second (Billions)', 'Instructions per Second vs Throughput',
-                          label1, label2, show_diff_overlay=show_diff_overlay, show_diff_subplot=show_diff_subplot, show_value_labels=show_value_labels, presentation_mode=presentation_mode)
+    create_comparison_plot(ax1, ax2, *plot_args, **plot_kwargs)
     
-    save_plot(fig, pdf, svg_dir, '01_instructions_per_second', presentation_mode)
+    return finish_figure(fig, svg_path, mode)
 
-def plot_throughput_vs_cpu(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2', presentation_mode=False):
+def render_throughput_vs_cpu(svg_path, x_positions, x_labels, recv1, recv2, cpu_util1, cpu_util2, label1='Dataset 1', label2='Dataset 2', mode='regular'):
     """Plot requested vs received throughput with CPU utilization overlay."""
     
-    figsize = get_figure_size(presentation_mode, False)
+    figsize = FIGSIZES[(mode, False)]
     fig, ax1 = plt.subplots(1, 1, figsize=figsize)
+    # Detach from pyplot (the figure is handed back to the parent process), keeping an Agg canvas for layout
+    plt.close(fig)
+    FigureCanvasAgg(fig)
     
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
-    
-    if presentation_mode:
-        title_size = PRESENTATION_TITLE_SIZE
-        axis_label_size = PRESENTATION_AXIS_LABEL_SIZE
-        legend_size = PRESENTATION_LEGEND_SIZE
-        line_width = PRESENTATION_LINE_WIDTH
-        marker_size = PRESENTATION_MARKER_SIZE
-    else:
-        title_size = REGULAR_TITLE_SIZE
-        axis_label_size = REGULAR_AXIS_LABEL_SIZE
-        legend_size = REGULAR_LEGEND_SIZE
-        line_width = REGULAR_LINE_WIDTH
-        marker_size = REGULAR_MARKER_SIZE
+    s = STYLE[mode]
+    title_size = s['title_size']
+    axis_label_size = s['axis_label_size']
+    legend_size = s['legend_size']
+    line_width = s['line_width']
+    marker_size = s['marker_size']
     
     # Plot throughput as lines instead of bars
-    line1 = ax1.plot(x_positions, df1['Recv Thrput (Mb/s)'], 'o-', label=f'{label1} Recv Throughput', 
+    line1 = ax1.plot(x_positions, recv1, 'o-', label=f'{label1} Recv Throughput', 
                      linewidth=line_width, markersize=marker_size, color=COLOR_BASELINE)
-    line2 = ax1.plot(x_positions, df2['Recv Thrput (Mb/s)'], 's-', label=f'{label2} Recv Throughput', 
+    line2 = ax1.plot(x_positions, recv2, 's-', label=f'{label2} Recv Throughput', 
                      linewidth=line_width, markersize=marker_size, color=COLOR_COMPARATOR)
     
     ax1.set_xlabel('Requested Throughput (Mb/s)', fontsize=axis_label_size)
@@ -241,8 +361,6 @@ def plot_throughput_vs_cpu(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='D
     ax1.set_xticklabels(x_labels, rotation=45)
     
     ax2 = ax1.twinx()
-    cpu_util1 = df1['CPU Util (Fraction)'] * 100
-    cpu_util2 = df2['CPU Util (Fraction)'] * 100
     
     # Use same colors for CPU utilization lines with different line styles
     line3 = ax2.plot(x_positions, cpu_util1, '^--', label=f'{label1} CPU Util', 
@@ -258,236 +376,69 @@ def plot_throughput_vs_cpu(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='D
     handles2, labels2 = ax2.get_legend_handles_labels()
     ax1.legend(handles1 + handles2, labels1 + labels2, loc='upper left', fontsize=legend_size)
     
-    save_plot(fig, pdf, svg_dir, '02_throughput_vs_cpu', presentation_mode)
-
-def plot_comprehensive_cpu_utilization(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2', show_diff_overlay=True, show_diff_subplot=False, show_value_labels=False, presentation_mode=False):
-    """Plot comprehensive CPU utilization using standard format with Total System + components."""
-    
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
-    
-    total_util1 = df1['CPU Util (Fraction)'] * 100
-    total_util2 = df2['CPU Util (Fraction)'] * 100
-    
-    figsize = get_figure_size(presentation_mode, show_diff_subplot)
-    if show_diff_subplot:
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
-    else:
-        fig, ax1 = plt.subplots(1, 1, figsize=figsize)
-        ax2 = None
-    
-    create_comparison_plot(ax1, ax2, x_positions, x_labels, total_util1, total_util2,
-                          'CPU Utilization (%)', 'Total System CPU Utilization vs Throughput',
-                          label1, label2, use_bars=True, show_diff_overlay=show_diff_overlay, show_diff_subplot=show_diff_subplot, show_value_labels=show_value_labels, presentation_mode=presentation_mode)
-    save_plot(fig, pdf, svg_dir, '03_total_cpu_utilization', presentation_mode)
-    
-    components = ['ethernet_driver', 'net_virt_tx', 'net_virt_rx', 'client0', 'client0_net_copier']
-    component_names = ['Ethernet Driver CPU Utilization', 'Net Virt TX CPU Utilization', 
-                       'Net Virt RX CPU Utilization', 'Client0 CPU Utilization', 'Client0 Net Copier CPU Utilization']
-    
-    for i, (component, name) in enumerate(zip(components, component_names)):
-        cpu_col = f'{component}_CPU_Util'
-        if cpu_col in df1.columns and cpu_col in df2.columns:
-            figsize = get_figure_size(presentation_mode, show_diff_subplot)
-            if show_diff_subplot:
-                fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
-            else:
-                fig, ax1 = plt.subplots(1, 1, figsize=figsize)
-                ax2 = None
-            
-            util1 = df1[cpu_col]
-            util2 = df2[cpu_col]
-            
-            create_comparison_plot(ax1, ax2, x_positions, x_labels, util1, util2,
-                                  'CPU Utilization (%)', f'{name} vs Throughput',
-                                  label1, label2, use_bars=True, show_diff_overlay=show_diff_overlay, show_diff_subplot=show_diff_subplot, show_value_labels=show_value_labels, presentation_mode=presentation_mode)
-            
-            save_plot(fig, pdf, svg_dir, f'04_{component}_utilization', presentation_mode)
-
-def plot_cpu_utilization(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2', show_diff_overlay=True, show_diff_subplot=False, show_value_labels=False, presentation_mode=False):
-    """Plot CPU utilization comparison."""
-    
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
-    
-    figsize = get_figure_size(presentation_mode, show_diff_subplot)
-    if show_diff_subplot:
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
-    else:
-        fig, ax1 = plt.subplots(1, 1, figsize=figsize)
-        ax2 = None
-    
-    cpu_util1 = df1['CPU Util (Fraction)'] * 100
-    cpu_util2 = df2['CPU Util (Fraction)'] * 100
-    
-    create_comparison_plot(ax1, ax2, x_positions, x_labels, cpu_util1, cpu_util2,
-                          'CPU Utilization (%)', 'System CPU Utilization vs Throughput',
-                          label1, label2, show_diff_overlay=show_diff_overlay, show_diff_subplot=show_diff_subplot, show_value_labels=show_value_labels, presentation_mode=presentation_mode)
-    
-    save_plot(fig, pdf, svg_dir, '05_system_cpu_utilization', presentation_mode)
-    
-    raw_cpu_metrics = [
-        ('Total Cycles', 'Total CPU Cycles'),
-        ('Kernel Cycles', 'Kernel CPU Cycles'),
-        ('User Cycles', 'User CPU Cycles'),
-        ('Idle Cycles', 'Idle CPU Cycles')
-    ]
-    
-    for i, (metric, title) in enumerate(raw_cpu_metrics):
-        if metric in df1.columns and metric in df2.columns:
-            figsize = get_figure_size(presentation_mode, show_diff_subplot)
-            if show_diff_subplot:
-                fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
-            else:
-                fig, ax1 = plt.subplots(1, 1, figsize=figsize)
-                ax2 = None
-            
-            values1 = df1[metric] / 1e9
-            values2 = df2[metric] / 1e9
-            
-            create_comparison_plot(ax1, ax2, x_positions, x_labels, values1, values2,
-                                  f'{metric} (Billions)', f'{title} vs Throughput',
-                                  label1, label2, show_diff_overlay=show_diff_overlay, show_diff_subplot=show_diff_subplot, show_value_labels=show_value_labels, presentation_mode=presentation_mode)
-            
-            save_plot(fig, pdf, svg_dir, f'06_{metric.lower().replace(" ", "_")}_cycles', presentation_mode)
+    return finish_figure(fig, svg_path, mode)
 
-def plot_cache_metrics(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2', show_diff_overlay=True, show_diff_subplot=False, show_value_labels=False, presentation_mode=False):
-    """Plot cache metrics comparisons."""
-    
-    raw_cache_metrics = [
-        ('L1 I-cache misses', 'L1 I-cache Misses (Total)'),
-        ('L1 D-cache misses', 'L1 D-cache Misses (Total)'),
-        ('L1 I-TLB misses', 'L1 I-TLB Misses (Total)'),
-        ('L1 D-TLB misses', 'L1 D-TLB Misses (Total)'),
-        ('Instructions', 'Instructions (Total)'),
-        ('Branch mispredictions', 'Branch Mispredictions (Total)')
-    ]
-    
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
-    
-    for i, (metric, title) in enumerate(raw_cache_metrics):
-        if metric in df1.columns and metric in df2.columns:
-            figsize = get_figure_size(presentation_mode, show_diff_subplot)
-            if show_diff_subplot:
-                fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
-            else:
-                fig, ax1 = plt.subplots(1, 1, figsize=figsize)
-                ax2 = None
-            
-            values1 = df1[metric] / 1e6
-            values2 = df2[metric] / 1e6
-            
-            create_comparison_plot(ax1, ax2, x_positions, x_labels, values1, values2,
-                                  f'{title.replace("(Total)", "(Millions)")}', f'{title} vs Throughput',
-                                  label1, label2, show_diff_overlay=show_diff_overlay, show_diff_subplot=show_diff_subplot, show_value_labels=show_value_labels, presentation_mode=presentation_mode)
-            
-            save_plot(fig, pdf, svg_dir, f'07_{metric.lower().replace(" ", "_").replace("-", "_")}_raw', presentation_mode)
-    
-    normalized_cache_metrics = [
-        ('L1 I-cache misses per packet', 'L1 I-cache Misses per Packet'),
-        ('L1 D-cache misses per packet', 'L1 D-cache Misses per Packet'),
-        ('L1 I-TLB misses per packet', 'L1 I-TLB Misses per Packet'),
-        ('L1 D-TLB misses per packet', 'L1 D-TLB Misses per Packet'),
-        ('instructions per packet', 'Instructions per Packet'),
-        ('Branch mis-pred per packet', 'Branch Mispredictions per Packet')
-    ]
-    
-    for i, (metric, title) in enumerate(normalized_cache_metrics):
-        if metric in df1.columns and metric in df2.columns:
-            figsize = get_figure_size(presentation_mode, show_diff_subplot)
-            if show_diff_subplot:
-                fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
-            else:
-                fig, ax1 = plt.subplots(1, 1, figsize=figsize)
-                ax2 = None
-            
-            values1 = df1[metric]
-            values2 = df2[metric]
-            
-            create_comparison_plot(ax1, ax2, x_positions, x_labels, values1, values2,
-                                  metric.replace('per packet', '/ Packet'), f'{title} vs Throughput',
-                                  label1, label2, show_diff_overlay=show_diff_overlay, show_diff_subplot=show_diff_subplot, show_value_labels=show_value_labels, presentation_mode=presentation_mode)
-            
-            save_plot(fig, pdf, svg_dir, f'08_{metric.lower().replace(" ", "_").replace("-", "_")}_normalized', presentation_mode)
+def save_plots(pdf, jobs, parallel):
+    """Render independent figures (across processes if parallel), adding PDF pages in job order."""
+    if not jobs:
+        return
+    if not parallel:
+        for render, args in jobs:
+            pdf.savefig(render(*args))
+        return
+    with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(render, *args) for render, args in jobs]
+        for future in futures:
+            fig = future.result()
+            pdf.savefig(fig)
+            # Release the page's artists now rather than when the next result replaces it
+            fig.clf()
 
-def plot_efficiency_metrics(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2', show_diff_overlay=True, show_diff_subplot=False, show_value_labels=False, presentation_mode=False):
-    """Plot efficiency metrics comparisons."""
-    
-    efficiency_metrics = [
-        ('Cycles Per Packet', 'Cycles per Packet', True),
-        ('instructions per packet', 'Instructions per Packet', True),
-        ('Branch mis-pred per packet', 'Branch Mispredictions per Packet', True),
-        ('Mean RTT (μs)', 'Mean Round-Trip Time (μs)', False)
-    ]
-    
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
+def render_all(pdf, svg_dir, data1, data2, x_positions, x_labels, label1='Dataset 1', label2='Dataset 2', show_diff_overlay=True, show_diff_subplot=False, show_value_labels=False, mode='regular'):
+    """Render every plot in PLOTS whose column is present in both datasets, in table order."""
+    
+    jobs = []
+    for filename, column, ylabel, title, divisor, use_bars in PLOTS:
+        if column not in data1 or column not in data2:
+            continue
+        svg_path = svg_dir / f'{filename}.svg' if svg_dir else None
+        
+        if filename == THROUGHPUT_VS_CPU_PLOT:
+            jobs.append((render_throughput_vs_cpu, (svg_path, x_positions, x_labels, data1[column], data2[column],
+                                                    data1['CPU Util (%)'], data2['CPU Util (%)'], label1, label2, mode)))
+            continue
+        
+        values1 = data1[column] / divisor
+        values2 = data2[column] / divisor
+        
+        jobs.append(comparison_job(svg_path, x_positions, x_labels, values1, values2,
+                                   ylabel, title,
+                                   label1, label2, use_bars, show_diff_overlay=show_diff_overlay, show_diff_subplot=show_diff_subplot, show_value_labels=show_value_labels, mode=mode))
     
-    for i, (metric, title, use_bars) in enumerate(efficiency_metrics):
-        if metric in df1.columns and metric in df2.columns:
-            figsize = get_figure_size(presentation_mode, show_diff_subplot)
-            if show_diff_subplot:
-                fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
-            else:
-                fig, ax1 = plt.subplots(1, 1, figsize=figsize)
-                ax2 = None
-            
-            values1 = df1[metric]
-            values2 = df2[metric]
-            
-            ylabel = title
-            create_comparison_plot(ax1, ax2, x_positions, x_labels, values1, values2,
-                                  ylabel, f'{title} vs Throughput',
-                                  label1, label2, use_bars, show_diff_overlay=show_diff_overlay, show_diff_subplot=show_diff_subplot, show_value_labels=show_value_labels, presentation_mode=presentation_mode)
-            
-            save_plot(fig, pdf, svg_dir, f'09_{metric.lower().replace(" ", "_").replace("-", "_").replace("(μs)", "")}_efficiency', presentation_mode)
+    # Workers only take the layout and SVG work off the parent, which still draws every PDF page,
+    # so processes pay for their startup and pickling only when SVGs are written on several CPUs
+    save_plots(pdf, jobs, parallel=svg_dir is not None and (os.cpu_count() or 1) > 1)
 
-def plot_packet_metrics(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2', show_diff_overlay=True, show_diff_subplot=False, show_value_labels=False, presentation_mode=False):
-    """Plot packet-related metrics comparisons."""
-    
-    packet_metrics = [
-        ('Packet Rate (p/s)', 'Packet Rate (packets/s)', 1000),
-        ('Recv Thrput (Mb/s)', 'Received Throughput (Mb/s)', 1),
-        ('Send Thrput (Mb/s)', 'Sent Throughput (Mb/s)', 1)
-    ]
-    
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
-    
-    for i, (metric, title, divisor) in enumerate(packet_metrics):
-        if metric in df1.columns and metric in df2.columns:
-            figsize = get_figure_size(presentation_mode, show_diff_subplot)
-            if show_diff_subplot:
-                fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
-            else:
-                fig, ax1 = plt.subplots(1, 1, figsize=figsize)
-                ax2 = None
-            
-            values1 = df1[metric] / divisor
-            values2 = df2[metric] / divisor
-            
-            ylabel = title.replace('(packets/s)', '(Kpps)') if divisor == 1000 else title
-            create_comparison_plot(ax1, ax2, x_positions, x_labels, values1, values2,
-                                  ylabel, f'{title} vs Throughput',
-                                  label1, label2, show_diff_overlay=show_diff_overlay, show_diff_subplot=show_diff_subplot, show_value_labels=show_value_labels, presentation_mode=presentation_mode)
-            
-            save_plot(fig, pdf, svg_dir, f'10_{metric.lower().replace(" ", "_").replace("(", "").replace(")", "").replace("/", "_")}_packets', presentation_mode)
+def compute_cache_key(csv_file1, csv_file2, *options):
+    """Hash the input files' mtime/size, this script's mtime and the plot options."""
+    parts = []
+    for path in (csv_file1, csv_file2, Path(__file__)):
+        stat = path.stat()
+        parts.append(f'{stat.st_mtime_ns}:{stat.st_size}')
+    parts.extend(repr(option) for option in options)
+    return hashlib.sha1('|'.join(parts).encode()).hexdigest()
 
 def main():
     if len(sys.argv) < 3 and len(sys.argv) != 1:
-        print("Usage: python plot.py <csv_file1> <csv_file2> [output_pdf] [label1] [label2] [--no-diff-overlay] [--show-diff-subplot] [--show-value-labels] [--regular-mode]")
+        print("Usage: python plot.py <csv_file1> <csv_file2> [output_pdf] [label1] [label2] [--no-diff-overlay] [--show-diff-subplot] [--show-value-labels] [--regular-mode] [--emit-svg] [--force]")
         print("Example: python plot.py baseline.csv optimized.csv comparison.pdf 'Baseline' 'Optimized'")
         print("Options:")
         print("  --no-diff-overlay    Don't show relative difference line overlay on main plots")
         print("  --show-diff-subplot  Show separate subplot for relative difference bars")
         print("  --show-value-labels  Show value labels on bars/points (default: off for cleaner look)")
         print("  --regular-mode       Use smaller fonts and thinner lines for detailed analysis (default: presentation mode)")
+        print("  --emit-svg           Also write each plot as an SVG into <output_pdf stem>_svgs/ (default: PDF only)")
+        print("  --force              Regenerate even if the inputs and options are unchanged since the last run")
         return
     
     if len(sys.argv) >= 3:
@@ -497,7 +448,9 @@ def main():
         show_diff_overlay = '--no-diff-overlay' not in sys.argv
         show_diff_subplot = '--show-diff-subplot' in sys.argv
         show_value_labels = '--show-value-labels' in sys.argv
-        presentation_mode = '--regular-mode' not in sys.argv
+        mode = 'regular' if '--regular-mode' in sys.argv else 'presentation'
+        emit_svg = '--emit-svg' in sys.argv
+        force = '--force' in sys.argv
         
         args = [arg for arg in sys.argv if not arg.startswith('--')]
         
@@ -513,7 +466,9 @@ def main():
         show_diff_overlay = True
         show_diff_subplot = False
         show_value_labels = False
-        presentation_mode = True
+        mode = 'presentation'
+        emit_svg = False
+        force = False
     
     if not csv_file1.exists():
         print(f"Error: {csv_file1} not found!")
@@ -522,26 +477,30 @@ def main():
         print(f"Error: {csv_file2} not found!")
         return
     
+    # Skip regeneration when the inputs, plot.py and every option match the last completed run
+    cache_key = compute_cache_key(csv_file1, csv_file2, output_file, label1, label2,
+                                  show_diff_overlay, show_diff_subplot, show_value_labels, mode, emit_svg)
+    cache_key_file = output_file.parent / f'.{output_file.name}.cache_key'
+    if not force and output_file.exists() and cache_key_file.exists() and cache_key_file.read_text() == cache_key:
+        print(f"{output_file} is up to date (use --force to regenerate)")
+        return
+    
     df1 = load_data(csv_file1)
     df2 = load_data(csv_file2)
+    data1 = to_plot_data(df1)
+    data2 = to_plot_data(df2)
     
-    svg_dir = output_file.parent / (output_file.stem + '_svgs')
-    svg_dir.mkdir(exist_ok=True)
+    throughput = data1['Requ Thrput (Mb/s)']
+    x_positions = np.arange(len(throughput))
+    x_labels = [f'{int(x)}' for x in throughput]
+    
+    svg_dir = None
+    if emit_svg:
+        svg_dir = output_file.parent / (output_file.stem + '_svgs')
+        svg_dir.mkdir(exist_ok=True)
     
     with PdfPages(output_file) as pdf:
-        plot_instructions_per_second(pdf, svg_dir, df1, df2, label1, label2, show_diff_overlay, show_diff_subplot, show_value_labels, presentation_mode)
-        
-        plot_throughput_vs_cpu(pdf, svg_dir, df1, df2, label1, label2, presentation_mode)
-        
-        plot_comprehensive_cpu_utilization(pdf, svg_dir, df1, df2, label1, label2, show_diff_overlay, show_diff_subplot, show_value_labels, presentation_mode)
-        
-        plot_cpu_utilization(pdf, svg_dir, df1, df2, label1, label2, show_diff_overlay, show_diff_subplot, show_value_labels, presentation_mode)
-        
-        plot_cache_metrics(pdf, svg_dir, df1, df2, label1, label2, show_diff_overlay, show_diff_subplot, show_value_labels, presentation_mode)
-        
-        plot_efficiency_metrics(pdf, svg_dir, df1, df2, label1, label2, show_diff_overlay, show_diff_subplot, show_value_labels, presentation_mode)
-        
-        plot_packet_metrics(pdf, svg_dir, df1, df2, label1, label2, show_diff_overlay, show_diff_subplot, show_value_labels, presentation_mode)
+        render_all(pdf, svg_dir, data1, data2, x_positions, x_labels, label1, label2, show_diff_overlay, show_diff_subplot, show_value_labels, mode)
         
         d = pdf.infodict()
         d['Title'] = 'Detailed Performance Comparison Plots'
@@ -549,6 +508,8 @@ def main():
         d['Subject'] = 'Detailed Network Performance Metrics Comparison'
         d['Keywords'] = 'Performance, Instructions, CPU Utilization, Cache, Throughput'
     
+    cache_key_file.write_text(cache_key)
+    
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""Generate both three-way comparison plots in one process.
+
+Running the plot scripts one after another pays matplotlib's import, style setup and
+font lookup once per script; importing them here pays it once for both.
+"""
+
+import plot_three_way_ethernet_cpu
+import plot_three_way_throughput_cpu
+
+
+def main():
+    plot_three_way_ethernet_cpu.main()
+    plot_three_way_throughput_cpu.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Style settings and constants shared by the three-way comparison plots.
+
+Importing this module selects the Agg backend and applies the same style and font
+settings as plot.py (presentation mode), so each script configures matplotlib once.
+"""
+
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive: files only
+import matplotlib.pyplot as plt
+import numpy as np
+
+# Apply the same style and font settings as plot.py
+plt.style.use('seaborn-v0_8-whitegrid')
+plt.rcParams['font.family'] = 'monospace'
+plt.rcParams['font.monospace'] = ['DejaVu Sans Mono', 'Consolas', 'Monaco', 'Courier New', 'monospace']
+
+COLOR_BASELINE = '#84A5C7'     # Blue for GCC
+COLOR_COMPARATOR1 = '#F18484'  # Red for CompCert
+COLOR_COMPARATOR2 = '#8BC34A'  # Soft green for PNK
+COLOR_DIFF_LINE = '#555555'    # Gray for diff lines
+
+# Use same sizing as plot.py (presentation mode)
+PRESENTATION_FIGSIZE = (16, 12)
+PRESENTATION_TITLE_SIZE = 24
+PRESENTATION_AXIS_LABEL_SIZE = 20
+PRESENTATION_LEGEND_SIZE = 18
+PRESENTATION_DIFF_LABEL_SIZE = 16
+PRESENTATION_LINE_WIDTH = 4
+PRESENTATION_MARKER_SIZE = 12
+PRESENTATION_DIFF_MARKER_SIZE = 14
+PRESENTATION_LAYOUT_PAD = 2.0  # In font sizes, as for tight_layout
+
+DIFF_LABEL_BBOX = dict(boxstyle='round,pad=0.2', facecolor='lightgray', alpha=0.7, edgecolor='gray', linewidth=0.5)
+
+
+# Cells pandas.read_csv reads as missing by default (parse.py writes missing values as 'NA')
+CSV_NA_VALUES = frozenset(['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+                           '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'])
+
+
+def csv_float_rows(rows, n_columns):
+    """Convert rows of CSV cell strings to an (n_rows, n_columns) float64 array, with NA cells as NaN."""
+    return np.array([['nan' if cell in CSV_NA_VALUES else cell for cell in row] for row in rows],
+                    dtype=np.float64).reshape(-1, n_columns)
+
+
+def pivot_rows(datasets, columns, requested_throughputs):
+    """Align datasets of {throughput: {column: value}} rows on requested_throughputs.
+
+    Returns {column: array} where each array has one row per dataset (in the order
+    given) and one column per requested throughput.
+    """
+    return {column: np.array([[rows[rt][column] for rt in requested_throughputs] for rows in datasets],
+                             dtype=np.float64)
+            for column in columns}
+
+
+def mm(values):
+    """Return (min, max) of an array as plain floats."""
+    return float(values.min()), float(values.max())
+
+
+def twin_axes_figure():
+    """Create a presentation-size figure with a twinned y axis, laid out by constrained layout."""
+    fig, ax1 = plt.subplots(figsize=PRESENTATION_FIGSIZE, layout='constrained')
+    # Constrained layout pads are in inches rather than font sizes
+    pad = PRESENTATION_LAYOUT_PAD * plt.rcParams['font.size'] / 72
+    fig.get_layout_engine().set(w_pad=pad, h_pad=pad)
+    return fig, ax1, ax1.twinx()
+
+
+def freeze_ylim(ax, values, sticky_bottom=False):
+    """Fix ax's y limits to what autoscaling would pick for values and turn y autoscaling off.
+
+    Called before plotting so artists added afterwards don't rescale the axis. With
+    sticky_bottom the lower limit is the data minimum itself, as for bars from zero.
+    """
+    lo, hi = float(np.nanmin(values)), float(np.nanmax(values))
+    margin = (hi - lo) * ax.margins()[1]
+    ax.set_ylim(lo if sticky_bottom else lo - margin, hi + margin)
+
+
+def save_figure(fig, basename):
+    """Write fig to final/<basename>.svg and .pdf, measuring the tight bbox only once."""
+    # Draw once and reuse the measured tight bounding box for both formats, so neither
+    # savefig needs its own layout pass to find it
+    fig.canvas.draw()
+    tight_bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(plt.rcParams['savefig.pad_inches'])
+    fig.savefig(f'final/{basename}.svg', format='svg', bbox_inches=tight_bbox)
+    fig.savefig(f'final/{basename}.pdf', format='pdf', bbox_inches=tight_bbox, metadata={'CreationDate': None})
+    plt.close(fig)
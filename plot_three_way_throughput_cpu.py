@@ -1,113 +1,154 @@
 #!/usr/bin/env python3
 
-import pandas as pd
-import matplotlib.pyplot as plt
+import csv
 import numpy as np
-
-# Apply the same style and font settings as plot.py
-plt.style.use('seaborn-v0_8-whitegrid')
-plt.rcParams['font.family'] = 'monospace'
-plt.rcParams['font.monospace'] = ['DejaVu Sans Mono', 'Consolas', 'Monaco', 'Courier New', 'monospace']
-
-COLOR_BASELINE = '#84A5C7'     # Blue for GCC
-COLOR_COMPARATOR1 = '#F18484'  # Red for CompCert  
-COLOR_COMPARATOR2 = '#8BC34A'  # Soft green for PNK
-
-# Use same sizing as plot.py (presentation mode)
-PRESENTATION_TITLE_SIZE = 24
-PRESENTATION_AXIS_LABEL_SIZE = 20
-PRESENTATION_LEGEND_SIZE = 18
-PRESENTATION_LINE_WIDTH = 4
-PRESENTATION_MARKER_SIZE = 12
-
-# Load data directly from CSV files
-gcc_df = pd.read_csv("../sddf_benchmark/new_results/gcc_meson.csv")
-compcert_df = pd.read_csv("../sddf_benchmark/new_results/compcert_meson.csv") 
-pnk_df = pd.read_csv("../sddf_benchmark/new_results/pnk_meson_ffi.csv")
-
-# Convert all datasets to consistent format
-for df, name in [(gcc_df, 'GCC'), (compcert_df, 'CompCert'), (pnk_df, 'PNK')]:
-    if 'Requested_Throughput' in df.columns:
-        df['Requ Thrput (Mb/s)'] = df['Requested_Throughput'] / 1000000
-        df['Recv Thrput (Mb/s)'] = df['Receive_Throughput'] / 1000000
-        # Calculate CPU utilization from idle cycles
-        df['CPU Util (%)'] = (1 - df['Idle_Cycles'] / df['Total_Cycles']) * 100
-
-# Get unique requested throughputs and sort them
-requested_throughputs = sorted(gcc_df['Requ Thrput (Mb/s)'].unique())
-
-# Extract data for each dataset
-gcc_recv_thrput = []
-gcc_cpu_util = []
-compcert_recv_thrput = []
-compcert_cpu_util = []
-pnk_recv_thrput = []
-pnk_cpu_util = []
-
-for rt in requested_throughputs:
-    # GCC data
-    gcc_row = gcc_df[gcc_df['Requ Thrput (Mb/s)'] == rt].iloc[0]
-    gcc_recv_thrput.append(gcc_row['Recv Thrput (Mb/s)'])
-    gcc_cpu_util.append(gcc_row['CPU Util (%)'])
-    
-    # CompCert data  
-    cc_row = compcert_df[compcert_df['Requ Thrput (Mb/s)'] == rt].iloc[0]
-    compcert_recv_thrput.append(cc_row['Recv Thrput (Mb/s)'])
-    compcert_cpu_util.append(cc_row['CPU Util (%)'])
-    
-    # PNK data
-    pnk_row = pnk_df[pnk_df['Requ Thrput (Mb/s)'] == rt].iloc[0]
-    pnk_recv_thrput.append(pnk_row['Recv Thrput (Mb/s)'])
-    pnk_cpu_util.append(pnk_row['CPU Util (%)'])
-
-# Create figure with twin y-axes (same size as plot.py presentation mode)
-fig, ax1 = plt.subplots(figsize=(16, 12))
-ax2 = ax1.twinx()
-
-# Plot throughput on left axis
-ax1.plot(requested_throughputs, gcc_recv_thrput, 
-         color=COLOR_BASELINE, linewidth=PRESENTATION_LINE_WIDTH, marker='o', markersize=PRESENTATION_MARKER_SIZE, 
-         label='C throughput', alpha=0.9)
-ax1.plot(requested_throughputs, compcert_recv_thrput, 
-         color=COLOR_COMPARATOR1, linewidth=PRESENTATION_LINE_WIDTH, marker='s', markersize=PRESENTATION_MARKER_SIZE, 
-         label='CompCert C throughput', alpha=0.9)
-ax1.plot(requested_throughputs, pnk_recv_thrput, 
-         color=COLOR_COMPARATOR2, linewidth=PRESENTATION_LINE_WIDTH, marker='^', markersize=PRESENTATION_MARKER_SIZE, 
-         label='Pancake throughput', alpha=0.9)
-
-# Plot CPU utilization on right axis (dashed lines)
-ax2.plot(requested_throughputs, gcc_cpu_util, 
-         color=COLOR_BASELINE, linewidth=PRESENTATION_LINE_WIDTH, linestyle='--', marker='o', markersize=PRESENTATION_MARKER_SIZE, 
-         label='C CPU util', alpha=0.7)
-ax2.plot(requested_throughputs, compcert_cpu_util, 
-         color=COLOR_COMPARATOR1, linewidth=PRESENTATION_LINE_WIDTH, linestyle='--', marker='s', markersize=PRESENTATION_MARKER_SIZE, 
-         label='CompCert C CPU util', alpha=0.7)
-ax2.plot(requested_throughputs, pnk_cpu_util, 
-         color=COLOR_COMPARATOR2, linewidth=PRESENTATION_LINE_WIDTH, linestyle='--', marker='^', markersize=PRESENTATION_MARKER_SIZE, 
-         label='Pancake CPU util', alpha=0.7)
-
-# Set labels and formatting
-ax1.set_xlabel('Requested Throughput (Mb/s)', fontsize=PRESENTATION_AXIS_LABEL_SIZE)
-ax1.set_ylabel('Receive Throughput (Mb/s)', fontsize=PRESENTATION_AXIS_LABEL_SIZE, color='black')
-ax2.set_ylabel('CPU Utilization (%)', fontsize=PRESENTATION_AXIS_LABEL_SIZE, color='gray')
-
-ax1.set_title('Throughput and CPU Utilisation vs Requested Throughput', fontsize=PRESENTATION_TITLE_SIZE, fontweight='bold')
-
-# Combine legends
-lines1, labels1 = ax1.get_legend_handles_labels()
-lines2, labels2 = ax2.get_legend_handles_labels()
-ax1.legend(lines1 + lines2, labels1 + labels2, loc='center right', fontsize=PRESENTATION_LEGEND_SIZE)
-
-ax1.grid(True, alpha=0.3)
-plt.tight_layout(pad=2.0)
-
-plt.savefig('final/three_way_throughput_cpu_twinx.svg', format='svg', bbox_inches='tight')
-plt.savefig('final/three_way_throughput_cpu_twinx.pdf', format='pdf', bbox_inches='tight')
-plt.close()
-
-print("Three-way throughput + CPU utilization plot saved to final/ as SVG and PDF")
-print(f"\nData Summary:")
-print(f"Requested throughputs: {[int(x) for x in requested_throughputs]}")
-print(f"GCC: {min(gcc_recv_thrput):.1f}-{max(gcc_recv_thrput):.1f} Mb/s, {min(gcc_cpu_util):.1f}-{max(gcc_cpu_util):.1f}% CPU")
-print(f"CompCert: {min(compcert_recv_thrput):.1f}-{max(compcert_recv_thrput):.1f} Mb/s, {min(compcert_cpu_util):.1f}-{max(compcert_cpu_util):.1f}% CPU")
-print(f"PNK: {min(pnk_recv_thrput):.1f}-{max(pnk_recv_thrput):.1f} Mb/s, {min(pnk_cpu_util):.1f}-{max(pnk_cpu_util):.1f}% CPU")
\ No newline at end of file
+import os
+import importlib.util
+
+import plot_common
+from plot_common import (
+    COLOR_BASELINE, COLOR_COMPARATOR1, COLOR_COMPARATOR2, PRESENTATION_AXIS_LABEL_SIZE,
+    PRESENTATION_LEGEND_SIZE, PRESENTATION_LINE_WIDTH, PRESENTATION_MARKER_SIZE,
+    PRESENTATION_TITLE_SIZE, csv_float_rows, freeze_ylim, mm, pivot_rows, save_figure, twin_axes_figure
+)
+
+# Load data directly from CSV files: the files are small and only the first row per
+# requested throughput is used, so a dict keyed by throughput is all the plot needs
+RAW_COLUMNS = ['Requested_Throughput', 'Receive_Throughput', 'Idle_Cycles', 'Total_Cycles']
+PLOT_COLUMNS = ['Recv Thrput (Mb/s)', 'CPU Util (%)']
+
+# pyarrow's multi-threaded CSV reader is used when it is installed, the csv module otherwise
+HAVE_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+def read_raw_columns(csv_path):
+    """Return the RAW_COLUMNS of a benchmark CSV as float64 arrays."""
+    if HAVE_PYARROW:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+        convert_options = pacsv.ConvertOptions(include_columns=RAW_COLUMNS,
+                                               column_types={name: pa.float64() for name in RAW_COLUMNS})
+        table = pacsv.read_csv(csv_path, convert_options=convert_options)
+        return [table.column(name).to_numpy() for name in RAW_COLUMNS]
+
+    with open(csv_path, newline='') as f:
+        raw = [[row[name] for name in RAW_COLUMNS] for row in csv.DictReader(f)]
+    return list(csv_float_rows(raw, len(RAW_COLUMNS)).T)
+
+def read_rows(csv_path):
+    """Return {requested Mb/s: {column: value}} for the first row at each throughput, in throughput order."""
+    requested, received, idle, total = read_raw_columns(csv_path)
+    requ = requested / 1000000
+    recv = received / 1000000
+    # Calculate CPU utilization from idle cycles
+    cpu = (1 - idle / total) * 100
+
+    # np.unique sorts the throughputs and gives each one's first row, so the dict comes
+    # out in throughput order and callers never need to sort it
+    requ, first = np.unique(requ, return_index=True)
+    return {rt: dict(zip(PLOT_COLUMNS, values))
+            for rt, *values in zip(requ.tolist(), recv[first].tolist(), cpu[first].tolist())}
+
+def load_cached(csv_path):
+    """read_rows(), cached next to the CSV as .rows.npz until the CSV, this script or plot_common changes."""
+    cache_path = csv_path + '.rows.npz'
+    # A newer copy of this script or of plot_common (csv_float_rows, the NA tokens) may compute
+    # the rows differently, so either one invalidates the cache too
+    newest_source = max(os.path.getmtime(csv_path), os.path.getmtime(__file__),
+                        os.path.getmtime(plot_common.__file__))
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= newest_source:
+        with np.load(cache_path) as cached:
+            columns = [cached[name].tolist() for name in PLOT_COLUMNS]
+            return {requ: dict(zip(PLOT_COLUMNS, values))
+                    for requ, *values in zip(cached['requ'].tolist(), *columns)}
+
+    rows = read_rows(csv_path)
+    try:
+        np.savez(cache_path, requ=np.array(list(rows), dtype=np.float64),
+                 **{name: np.array([r[name] for r in rows.values()], dtype=np.float64) for name in PLOT_COLUMNS})
+    except OSError as e:
+        print(f"Warning: could not write cache {cache_path}: {e}")
+    return rows
+
+def load_throughput_data():
+    """Receive throughput and CPU utilization per requested throughput for each dataset."""
+    gcc_rows = load_cached("../sddf_benchmark/new_results/gcc_meson.csv")
+    compcert_rows = load_cached("../sddf_benchmark/new_results/compcert_meson.csv")
+    pnk_rows = load_cached("../sddf_benchmark/new_results/pnk_meson_ffi.csv")
+
+    # Unique requested throughputs (the rows are already keyed in sorted order)
+    requested_throughputs = list(gcc_rows)
+
+    # Extract data for all datasets at once: one row per dataset in GCC, CompCert, PNK order
+    wide = pivot_rows([gcc_rows, compcert_rows, pnk_rows], PLOT_COLUMNS, requested_throughputs)
+
+    data = {'requested_throughputs': requested_throughputs}
+    for i, name in enumerate(['gcc', 'compcert', 'pnk']):
+        data[f'{name}_recv_thrput'] = wide['Recv Thrput (Mb/s)'][i]
+        data[f'{name}_cpu_util'] = wide['CPU Util (%)'][i]
+    return data
+
+def make_throughput_plot(ax1, ax2, data):
+    """Draw receive throughput (ax1, solid) and CPU utilization (ax2, dashed) lines."""
+    requested_throughputs = data['requested_throughputs']
+
+    # Fix both y ranges up front so the lines added below don't each rescale them
+    freeze_ylim(ax1, [data[f'{name}_recv_thrput'] for name in ['gcc', 'compcert', 'pnk']])
+    freeze_ylim(ax2, [data[f'{name}_cpu_util'] for name in ['gcc', 'compcert', 'pnk']])
+
+    # Plot throughput on left axis
+    ax1.plot(requested_throughputs, data['gcc_recv_thrput'],
+             color=COLOR_BASELINE, linewidth=PRESENTATION_LINE_WIDTH, marker='o', markersize=PRESENTATION_MARKER_SIZE,
+             label='C throughput', alpha=0.9)
+    ax1.plot(requested_throughputs, data['compcert_recv_thrput'],
+             color=COLOR_COMPARATOR1, linewidth=PRESENTATION_LINE_WIDTH, marker='s', markersize=PRESENTATION_MARKER_SIZE,
+             label='CompCert C throughput', alpha=0.9)
+    ax1.plot(requested_throughputs, data['pnk_recv_thrput'],
+             color=COLOR_COMPARATOR2, linewidth=PRESENTATION_LINE_WIDTH, marker='^', markersize=PRESENTATION_MARKER_SIZE,
+             label='Pancake throughput', alpha=0.9)
+
+    # Plot CPU utilization on right axis (dashed lines)
+    ax2.plot(requested_throughputs, data['gcc_cpu_util'],
+             color=COLOR_BASELINE, linewidth=PRESENTATION_LINE_WIDTH, linestyle='--', marker='o', markersize=PRESENTATION_MARKER_SIZE,
+             label='C CPU util', alpha=0.7)
+    ax2.plot(requested_throughputs, data['compcert_cpu_util'],
+             color=COLOR_COMPARATOR1, linewidth=PRESENTATION_LINE_WIDTH, linestyle='--', marker='s', markersize=PRESENTATION_MARKER_SIZE,
+             label='CompCert C CPU util', alpha=0.7)
+    ax2.plot(requested_throughputs, data['pnk_cpu_util'],
+             color=COLOR_COMPARATOR2, linewidth=PRESENTATION_LINE_WIDTH, linestyle='--', marker='^', markersize=PRESENTATION_MARKER_SIZE,
+             label='Pancake CPU util', alpha=0.7)
+
+    # Set labels and formatting
+    ax1.set_xlabel('Requested Throughput (Mb/s)', fontsize=PRESENTATION_AXIS_LABEL_SIZE)
+    ax1.set_ylabel('Receive Throughput (Mb/s)', fontsize=PRESENTATION_AXIS_LABEL_SIZE, color='black')
+    ax2.set_ylabel('CPU Utilization (%)', fontsize=PRESENTATION_AXIS_LABEL_SIZE, color='gray')
+
+    ax1.set_title('Throughput and CPU Utilisation vs Requested Throughput', fontsize=PRESENTATION_TITLE_SIZE, fontweight='bold')
+
+    # Combine legends
+    lines1, labels1 = ax1.get_legend_handles_labels()
+    lines2, labels2 = ax2.get_legend_handles_labels()
+    ax1.legend(lines1 + lines2, labels1 + labels2, loc='center right', fontsize=PRESENTATION_LEGEND_SIZE)
+
+    ax1.grid(True, alpha=0.3)
+
+def print_summary(data):
+    print(f"\nData Summary:")
+    print(f"Requested throughputs: {[int(x) for x in data['requested_throughputs']]}")
+    for name, key in [('GCC', 'gcc'), ('CompCert', 'compcert'), ('PNK', 'pnk')]:
+        (recv_lo, recv_hi), (cpu_lo, cpu_hi) = mm(data[f'{key}_recv_thrput']), mm(data[f'{key}_cpu_util'])
+        print(f"{name}: {recv_lo:.1f}-{recv_hi:.1f} Mb/s, {cpu_lo:.1f}-{cpu_hi:.1f}% CPU")
+
+def main():
+    data = load_throughput_data()
+
+    # Create figure with twin y-axes (same size as plot.py presentation mode)
+    fig, ax1, ax2 = twin_axes_figure()
+    make_throughput_plot(ax1, ax2, data)
+
+    save_figure(fig, 'three_way_throughput_cpu_twinx')
+
+    print("Three-way throughput + CPU utilization plot saved to final/ as SVG and PDF")
+    print_summary(data)
+
+if __name__ == "__main__":
+    main()
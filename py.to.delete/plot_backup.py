@@ -4,19 +4,79 @@ Detailed comparison plots with raw values (top) and relative differences (bottom
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+import matplotlib.style
+from matplotlib.figure import Figure
 import numpy as np
 from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import sys
 from pathlib import Path
 import os
+import importlib.util
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+# pyarrow's CSV parser is used when it is installed
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
 
 # Set style for better-looking plots
-plt.style.use('seaborn-v0_8-darkgrid')
+matplotlib.style.use('seaborn-v0_8-darkgrid')
+
+COMPONENTS = ['ethernet_driver', 'net_virt_tx', 'net_virt_rx', 'client0', 'client0_net_copier']
+COMPONENT_NAMES = ['Ethernet Driver CPU Utilization', 'Net Virt TX CPU Utilization', 
+                   'Net Virt RX CPU Utilization', 'Client0 CPU Utilization', 'Client0 Net Copier CPU Utilization']
+
+RAW_CPU_METRICS = [
+    ('Total Cycles', 'Total CPU Cycles'),
+    ('Kernel Cycles', 'Kernel CPU Cycles'),
+    ('User Cycles', 'User CPU Cycles'),
+    ('Idle Cycles', 'Idle CPU Cycles')
+]
+
+RAW_CACHE_METRICS = [
+    ('L1 I-cache misses', 'L1 I-cache Misses (Total)'),
+    ('L1 D-cache misses', 'L1 D-cache Misses (Total)'),
+    ('L1 I-TLB misses', 'L1 I-TLB Misses (Total)'),
+    ('L1 D-TLB misses', 'L1 D-TLB Misses (Total)'),
+    ('Instructions', 'Instructions (Total)'),
+    ('Branch mispredictions', 'Branch Mispredictions (Total)')
+]
+
+NORMALIZED_CACHE_METRICS = [
+    ('L1 I-cache misses per packet', 'L1 I-cache Misses per Packet'),
+    ('L1 D-cache misses per packet', 'L1 D-cache Misses per Packet'),
+    ('L1 I-TLB misses per packet', 'L1 I-TLB Misses per Packet'),
+    ('L1 D-TLB misses per packet', 'L1 D-TLB Misses per Packet'),
+    ('instructions per packet', 'Instructions per Packet'),
+    ('Branch mis-pred per packet', 'Branch Mispredictions per Packet')
+]
+
+EFFICIENCY_METRICS = [
+    ('Cycles Per Packet', 'Cycles per Packet', True),
+    ('instructions per packet', 'Instructions per Packet', True),
+    ('Branch mis-pred per packet', 'Branch Mispredictions per Packet', True),
+    ('Mean RTT (μs)', 'Mean Round-Trip Time (μs)', False)  # Use line plot for RTT trends
+]
+
+PACKET_METRICS = [
+    ('Packet Rate (p/s)', 'Packet Rate (packets/s)', 1000),  # Convert to kpps
+    ('Recv Thrput (Mb/s)', 'Received Throughput (Mb/s)', 1),
+    ('Send Thrput (Mb/s)', 'Sent Throughput (Mb/s)', 1)
+]
+
+# Only these columns are read from the CSVs, all as float64
+REQUIRED_COLUMNS = {'Requ Thrput (Mb/s)', 'Kernel Cycles', 'CPU Util (Fraction)', 'Instructions per Second', 'Recv Thrput (Mb/s)'}
+REQUIRED_COLUMNS.update(f'{component}_CPU_Util' for component in COMPONENTS)
+for metrics in (RAW_CPU_METRICS, RAW_CACHE_METRICS, NORMALIZED_CACHE_METRICS, EFFICIENCY_METRICS, PACKET_METRICS):
+    REQUIRED_COLUMNS.update(metric[0] for metric in metrics)
 
 def load_data(csv_file):
     """Load CSV data into a pandas DataFrame and filter out incomplete records."""
-    df = pd.read_csv(csv_file)
+    # The pyarrow engine needs usecols as a list, so pick the required columns from the header
+    header = pd.read_csv(csv_file, nrows=0).columns
+    usecols = [col for col in header if col in REQUIRED_COLUMNS]
+    df = pd.read_csv(csv_file, engine=CSV_ENGINE, usecols=usecols, dtype=dict.fromkeys(usecols, 'float64'))
     
     # Filter out rows where critical metrics are NaN (incomplete records)
     # Use 'Kernel Cycles' as indicator since it should always be present for complete records
@@ -28,50 +88,55 @@ def load_data(csv_file):
     print(f"Loaded {len(df)} complete records (filtered out incomplete ones)")
     return df
 
+def scaled_columns(df, metrics, divisor=1):
+    """Return {metric: float64 array / divisor} for the metrics present in df, converted once."""
+    return {m: df[m].to_numpy(dtype=np.float64) / divisor for m in metrics if m in df.columns}
+
 def calculate_relative_diff(baseline, comparison):
     """Calculate relative difference as percentage: (comparison - baseline) / baseline * 100"""
     return ((comparison - baseline) / baseline) * 100
 
+def _axis_prep(df):
+    """Return the x positions and requested-throughput tick labels for df's rows."""
+    throughput = df['Requ Thrput (Mb/s)'].to_numpy()
+    return np.arange(len(throughput), dtype=np.float64), np.char.mod('%d', throughput)
+
+def format_value_labels(values):
+    """Format values to 1 decimal place (>= 10) or 2 for the value labels."""
+    return np.where(values >= 10, np.char.mod('%.1f', values), np.char.mod('%.2f', values))
+
+def _annotate(ax, xs, ys, labels, color):
+    """Place one small centered label above each (x, y) point."""
+    for x, y, label in zip(xs, ys, labels):
+        ax.text(x, y, label, ha='center', va='bottom', fontsize=8, color=color)
+
 def create_comparison_plot(ax1, ax2, x_positions, x_labels, y1, y2, ylabel, title, label1, label2, use_bars=True):
     """Create a standard comparison plot with raw values (top) and relative diff (bottom)."""
     
-    # Round values to match what will be displayed
-    y1_displayed = np.array([float(f'{val:.1f}') if val >= 10 else float(f'{val:.2f}') for val in y1])
-    y2_displayed = np.array([float(f'{val:.1f}') if val >= 10 else float(f'{val:.2f}') for val in y2])
+    y1 = np.asarray(y1, dtype=np.float64)
+    y2 = np.asarray(y2, dtype=np.float64)
+    y1_labels = format_value_labels(y1)
+    y2_labels = format_value_labels(y2)
     
     # Top plot: Raw comparison
     if use_bars:
         width = 0.35
-        x1 = np.array(x_positions) - width/2
-        x2 = np.array(x_positions) + width/2
+        x1 = x_positions - width/2
+        x2 = x_positions + width/2
         
-        bars1 = ax1.bar(x1, y1, width, label=label1, color='#5D6D7E', alpha=0.9)  # Soft gray
-        bars2 = ax1.bar(x2, y2, width, label=label2, color='#85C1E9', alpha=0.9)  # Soft light blue
+        bars1 = ax1.bar(x1, y1, width, label=label1, color='#5D6D7E')  # Soft gray
+        bars2 = ax1.bar(x2, y2, width, label=label2, color='#85C1E9')  # Soft light blue
         
         # Add data labels on bars
-        for bar, val, disp_val in zip(bars1, y1, y1_displayed):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                    f'{disp_val:.1f}' if val >= 10 else f'{disp_val:.2f}',
-                    ha='center', va='bottom', fontsize=8, color='#5D6D7E')
-        
-        for bar, val, disp_val in zip(bars2, y2, y2_displayed):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                    f'{disp_val:.1f}' if val >= 10 else f'{disp_val:.2f}',
-                    ha='center', va='bottom', fontsize=8, color='#85C1E9')
+        ax1.bar_label(bars1, labels=y1_labels, padding=2, fontsize=8, color='#5D6D7E')
+        ax1.bar_label(bars2, labels=y2_labels, padding=2, fontsize=8, color='#85C1E9')
     else:
         ax1.plot(x_positions, y1, 'o-', label=label1, linewidth=2, markersize=8, color='#5D6D7E')  # Soft gray
         ax1.plot(x_positions, y2, 's-', label=label2, linewidth=2, markersize=8, color='#85C1E9')  # Soft light blue
         
         # Add data labels on line points
-        for x, val, disp_val in zip(x_positions, y1, y1_displayed):
-            ax1.text(x, val + max(y1)*0.02, f'{disp_val:.1f}' if val >= 10 else f'{disp_val:.2f}',
-                    ha='center', va='bottom', fontsize=8, color='#5D6D7E')
-        
-        for x, val, disp_val in zip(x_positions, y2, y2_displayed):
-            ax1.text(x, val + max(y2)*0.02, f'{disp_val:.1f}' if val >= 10 else f'{disp_val:.2f}',
-                    ha='center', va='bottom', fontsize=8, color='#85C1E9')
+        _annotate(ax1, x_positions, y1 + y1.max()*0.02, y1_labels, '#5D6D7E')
+        _annotate(ax1, x_positions, y2 + y2.max()*0.02, y2_labels, '#85C1E9')
     
     ax1.set_ylabel(ylabel, fontsize=12)
     ax1.set_title(title, fontsize=14, fontweight='bold')
@@ -80,10 +145,10 @@ def create_comparison_plot(ax1, ax2, x_positions, x_labels, y1, y2, ylabel, titl
     ax1.set_xticks(x_positions)
     ax1.set_xticklabels(x_labels, rotation=45)
     
-    # Bottom plot: Relative difference - use displayed values for consistency
-    rel_diff = calculate_relative_diff(y1_displayed, y2_displayed)
-    colors = ['#27AE60' if x >= 0 else '#E67E22' for x in rel_diff]  # Simple green for positive, simple orange for negative
-    bars = ax2.bar(x_positions, rel_diff, color=colors, alpha=0.8)
+    # Bottom plot: Relative difference of the raw values (the labels are rounded for display only)
+    rel_diff = calculate_relative_diff(y1, y2)
+    colors = np.where(rel_diff >= 0, '#27AE60', '#E67E22')  # Simple green for positive, simple orange for negative
+    bars = ax2.bar(x_positions, rel_diff, color=colors)
     
     ax2.set_xlabel('Requested Throughput (Mb/s)', fontsize=12)
     ax2.set_ylabel('Relative Difference (%)', fontsize=12)
@@ -93,32 +158,63 @@ def create_comparison_plot(ax1, ax2, x_positions, x_labels, y1, y2, ylabel, titl
     ax2.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
     ax2.grid(True, alpha=0.3, axis='y')
     
-    # Add value labels on bars
-    for bar, val in zip(bars, rel_diff):
-        height = bar.get_height()
-        if abs(height) > 0.1:  # Only show labels for non-zero differences
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{val:.1f}%', ha='center', va='bottom' if height >= 0 else 'top', fontsize=8)
+    # Add value labels on bars (blank for differences that are effectively zero)
+    rel_diff_labels = np.where(np.abs(rel_diff) > 0.1, np.char.mod('%.1f%%', rel_diff), '')
+    ax2.bar_label(bars, labels=rel_diff_labels, fontsize=8)
 
 def save_plot(fig, pdf, svg_dir, filename):
-    """Save plot to both PDF and SVG (if svg_dir provided)."""
-    plt.tight_layout()
-    pdf.savefig(fig)
+    """Save plot to PDF and SVG (if svg_dir provided); figures are laid out by constrained layout.
+
+    In a worker process pdf is a list, and the page is added as a pickled snapshot for the
+    parent to draw (the comparison figure is cleared for the next plot).
+    """
+    if isinstance(pdf, list):
+        pdf.append(pickle.dumps(fig))
+        if svg_dir:
+            # There is no PDF draw here, so run the layout without rendering anything
+            fig.draw_without_rendering()
+    else:
+        pdf.savefig(fig)
     if svg_dir:
-        plt.savefig(svg_dir / f'{filename}.svg', format='svg', bbox_inches='tight')
-    plt.close()
+        # The figure has already been laid out, so measure its tight bbox directly
+        # instead of letting bbox_inches='tight' do a second, throwaway draw
+        tight_bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(matplotlib.rcParams['savefig.pad_inches'])
+        fig.savefig(svg_dir / f'{filename}.svg', format='svg', bbox_inches=tight_bbox)
+
+def render_pages(plot_func, svg_dir, df1, df2, label1, label2):
+    """Run one plot_* function (in a worker process) and return its pickled PDF pages."""
+    pages = []
+    plot_func(pages, svg_dir, df1, df2, label1, label2)
+    return pages
+
+# The raw/relative-difference figure shared by every comparison plot, created on first use
+_comparison_figure = None
+
+def comparison_figure():
+    """Return the shared two-row comparison figure and its axes, cleared for the next plot."""
+    global _comparison_figure
+    if _comparison_figure is None:
+        # Built outside pyplot, with an Agg canvas for drawing
+        fig = Figure(figsize=(12, 10), constrained_layout=True)
+        FigureCanvasAgg(fig)
+        ax1, ax2 = fig.subplots(2, 1)
+        _comparison_figure = (fig, ax1, ax2)
+        return _comparison_figure
+    
+    fig, ax1, ax2 = _comparison_figure
+    ax1.clear()
+    ax2.clear()
+    return _comparison_figure
 
 def plot_instructions_per_second(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2'):
     """Plot instructions per second comparison."""
     
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    fig, ax1, ax2 = comparison_figure()
     
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
+    x_positions, x_labels = _axis_prep(df1)
     
-    inst_per_sec1 = df1['Instructions per Second'] / 1e9  # Convert to billions
-    inst_per_sec2 = df2['Instructions per Second'] / 1e9
+    inst_per_sec1 = df1['Instructions per Second'].to_numpy(dtype=np.float64) / 1e9  # Convert to billions
+    inst_per_sec2 = df2['Instructions per Second'].to_numpy(dtype=np.float64) / 1e9
     
     create_comparison_plot(ax1, ax2, x_positions, x_labels, inst_per_sec1, inst_per_sec2,
                           'Instructions per Second (Billions)', 'Instructions per Second vs Throughput',
@@ -129,35 +225,26 @@ def plot_instructions_per_second(pdf, svg_dir, df1, df2, label1='Dataset 1', lab
 def plot_throughput_vs_cpu(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2'):
     """Plot requested vs received throughput with CPU utilization overlay."""
     
-    fig, ax1 = plt.subplots(1, 1, figsize=(12, 8))
+    fig = Figure(figsize=(12, 8), constrained_layout=True)
+    FigureCanvasAgg(fig)
+    ax1 = fig.subplots()
     
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
+    x_positions, x_labels = _axis_prep(df1)
     
     # Throughput bars with CPU utilization line
     width = 0.35
-    x1 = np.array(x_positions) - width/2
-    x2 = np.array(x_positions) + width/2
+    x1 = x_positions - width/2
+    x2 = x_positions + width/2
     
     # Throughput bars
     bars1 = ax1.bar(x1, df1['Recv Thrput (Mb/s)'], width, label=f'{label1} Recv Throughput', 
-                    color='#5D6D7E', alpha=0.9)  # Soft gray
+                    color='#5D6D7E')  # Soft gray
     bars2 = ax1.bar(x2, df2['Recv Thrput (Mb/s)'], width, label=f'{label2} Recv Throughput', 
-                    color='#85C1E9', alpha=0.9)  # Soft light blue
+                    color='#85C1E9')  # Soft light blue
     
     # Add data labels on throughput bars
-    for bar, val in zip(bars1, df1['Recv Thrput (Mb/s)']):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                f'{val:.1f}',
-                ha='center', va='bottom', fontsize=8, color='#5D6D7E')
-    
-    for bar, val in zip(bars2, df2['Recv Thrput (Mb/s)']):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                f'{val:.1f}',
-                ha='center', va='bottom', fontsize=8, color='#85C1E9')
+    ax1.bar_label(bars1, labels=np.char.mod('%.1f', df1['Recv Thrput (Mb/s)'].to_numpy()), padding=2, fontsize=8, color='#5D6D7E')
+    ax1.bar_label(bars2, labels=np.char.mod('%.1f', df2['Recv Thrput (Mb/s)'].to_numpy()), padding=2, fontsize=8, color='#85C1E9')
     
     ax1.set_xlabel('Requested Throughput (Mb/s)', fontsize=12)
     ax1.set_ylabel('Received Throughput (Mb/s)', fontsize=12)
@@ -177,13 +264,9 @@ def plot_throughput_vs_cpu(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='D
                      linewidth=3, markersize=8, color='#000000')  # Black
     
     # Add data labels on CPU utilization line points
-    for x, val in zip(x_positions, cpu_util1):
-        ax2.text(x, val + 2, f'{val:.1f}%',
-                ha='center', va='bottom', fontsize=8, color='#2C3E50')
-    
-    for x, val in zip(x_positions, cpu_util2):
-        ax2.text(x, val + 2, f'{val:.1f}%',
-                ha='center', va='bottom', fontsize=8, color='#000000')
+    cpu_util1, cpu_util2 = cpu_util1.to_numpy(), cpu_util2.to_numpy()
+    _annotate(ax2, x_positions, cpu_util1 + 2, np.char.mod('%.1f%%', cpu_util1), '#2C3E50')
+    _annotate(ax2, x_positions, cpu_util2 + 2, np.char.mod('%.1f%%', cpu_util2), '#000000')
     
     ax2.set_ylabel('CPU Utilization (%)', fontsize=12)
     ax2.set_ylim(0, 105)  # Set scale from 0 to 105%
@@ -197,35 +280,32 @@ def plot_throughput_vs_cpu(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='D
     save_plot(fig, pdf, svg_dir, '02_throughput_vs_cpu')
 
 def plot_comprehensive_cpu_utilization(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2'):
-    """Plot comprehensive CPU utilization using standard format with Total System + components."""
+    """Plot comprehensive CPU utilization using standard format with Total System + COMPONENTS."""
     
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
+    x_positions, x_labels = _axis_prep(df1)
     
     # Get system total CPU utilization
-    total_util1 = df1['CPU Util (Fraction)'] * 100
-    total_util2 = df2['CPU Util (Fraction)'] * 100
+    total_util1 = df1['CPU Util (Fraction)'].to_numpy(dtype=np.float64) * 100
+    total_util2 = df2['CPU Util (Fraction)'].to_numpy(dtype=np.float64) * 100
     
     # System total plot
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    fig, ax1, ax2 = comparison_figure()
     create_comparison_plot(ax1, ax2, x_positions, x_labels, total_util1, total_util2,
                           'CPU Utilization (%)', 'Total System CPU Utilization vs Throughput',
                           label1, label2, use_bars=True)
     save_plot(fig, pdf, svg_dir, '03_total_cpu_utilization')
     
     # Plot each component separately using standard format
-    components = ['ethernet_driver', 'net_virt_tx', 'net_virt_rx', 'client0', 'client0_net_copier']
-    component_names = ['Ethernet Driver CPU Utilization', 'Net Virt TX CPU Utilization', 
-                       'Net Virt RX CPU Utilization', 'Client0 CPU Utilization', 'Client0 Net Copier CPU Utilization']
+    cpu_cols = [f'{component}_CPU_Util' for component in COMPONENTS]
+    scaled1, scaled2 = scaled_columns(df1, cpu_cols), scaled_columns(df2, cpu_cols)
     
-    for i, (component, name) in enumerate(zip(components, component_names)):
+    for i, (component, name) in enumerate(zip(COMPONENTS, COMPONENT_NAMES)):
         cpu_col = f'{component}_CPU_Util'
-        if cpu_col in df1.columns and cpu_col in df2.columns:
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+        if cpu_col in scaled1 and cpu_col in scaled2:
+            fig, ax1, ax2 = comparison_figure()
             
-            util1 = df1[cpu_col]
-            util2 = df2[cpu_col]
+            util1 = scaled1[cpu_col]
+            util2 = scaled2[cpu_col]
             
             create_comparison_plot(ax1, ax2, x_positions, x_labels, util1, util2,
                                   'CPU Utilization (%)', f'{name} vs Throughput',
@@ -236,14 +316,12 @@ def plot_comprehensive_cpu_utilization(pdf, svg_dir, df1, df2, label1='Dataset 1
 def plot_cpu_utilization(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2'):
     """Plot CPU utilization comparison."""
     
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
+    x_positions, x_labels = _axis_prep(df1)
     
     # CPU Utilization percentage
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
-    cpu_util1 = df1['CPU Util (Fraction)'] * 100
-    cpu_util2 = df2['CPU Util (Fraction)'] * 100
+    fig, ax1, ax2 = comparison_figure()
+    cpu_util1 = df1['CPU Util (Fraction)'].to_numpy(dtype=np.float64) * 100
+    cpu_util2 = df2['CPU Util (Fraction)'].to_numpy(dtype=np.float64) * 100
     
     create_comparison_plot(ax1, ax2, x_positions, x_labels, cpu_util1, cpu_util2,
                           'CPU Utilization (%)', 'System CPU Utilization vs Throughput',
@@ -251,20 +329,16 @@ def plot_cpu_utilization(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dat
     
     save_plot(fig, pdf, svg_dir, '05_system_cpu_utilization')
     
-    # Raw CPU cycle metrics
-    raw_cpu_metrics = [
-        ('Total Cycles', 'Total CPU Cycles'),
-        ('Kernel Cycles', 'Kernel CPU Cycles'),
-        ('User Cycles', 'User CPU Cycles'),
-        ('Idle Cycles', 'Idle CPU Cycles')
-    ]
+    # Raw CPU cycle metrics, converted to billions for readability
+    metrics = [metric for metric, _ in RAW_CPU_METRICS]
+    scaled1, scaled2 = scaled_columns(df1, metrics, 1e9), scaled_columns(df2, metrics, 1e9)
     
-    for i, (metric, title) in enumerate(raw_cpu_metrics):
-        if metric in df1.columns and metric in df2.columns:
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    for i, (metric, title) in enumerate(RAW_CPU_METRICS):
+        if metric in scaled1 and metric in scaled2:
+            fig, ax1, ax2 = comparison_figure()
             
-            values1 = df1[metric] / 1e9  # Convert to billions for readability
-            values2 = df2[metric] / 1e9
+            values1 = scaled1[metric]
+            values2 = scaled2[metric]
             
             create_comparison_plot(ax1, ax2, x_positions, x_labels, values1, values2,
                                   f'{metric} (Billions)', f'{title} vs Throughput',
@@ -275,27 +349,17 @@ def plot_cpu_utilization(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dat
 def plot_cache_metrics(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2'):
     """Plot cache metrics comparisons."""
     
-    # Raw cache metrics (total counts)
-    raw_cache_metrics = [
-        ('L1 I-cache misses', 'L1 I-cache Misses (Total)'),
-        ('L1 D-cache misses', 'L1 D-cache Misses (Total)'),
-        ('L1 I-TLB misses', 'L1 I-TLB Misses (Total)'),
-        ('L1 D-TLB misses', 'L1 D-TLB Misses (Total)'),
-        ('Instructions', 'Instructions (Total)'),
-        ('Branch mispredictions', 'Branch Mispredictions (Total)')
-    ]
-    
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
+    x_positions, x_labels = _axis_prep(df1)
     
-    # Plot raw cache metrics
-    for i, (metric, title) in enumerate(raw_cache_metrics):
-        if metric in df1.columns and metric in df2.columns:
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    # Plot raw cache metrics (converted to millions for readability)
+    metrics = [metric for metric, _ in RAW_CACHE_METRICS]
+    scaled1, scaled2 = scaled_columns(df1, metrics, 1e6), scaled_columns(df2, metrics, 1e6)
+    for i, (metric, title) in enumerate(RAW_CACHE_METRICS):
+        if metric in scaled1 and metric in scaled2:
+            fig, ax1, ax2 = comparison_figure()
             
-            values1 = df1[metric] / 1e6  # Convert to millions for readability
-            values2 = df2[metric] / 1e6
+            values1 = scaled1[metric]
+            values2 = scaled2[metric]
             
             create_comparison_plot(ax1, ax2, x_positions, x_labels, values1, values2,
                                   f'{title.replace("(Total)", "(Millions)")}', f'{title} vs Throughput',
@@ -303,23 +367,15 @@ def plot_cache_metrics(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Datas
             
             save_plot(fig, pdf, svg_dir, f'07_{metric.lower().replace(" ", "_").replace("-", "_")}_raw')
     
-    # Normalized cache metrics (per packet)
-    normalized_cache_metrics = [
-        ('L1 I-cache misses per packet', 'L1 I-cache Misses per Packet'),
-        ('L1 D-cache misses per packet', 'L1 D-cache Misses per Packet'),
-        ('L1 I-TLB misses per packet', 'L1 I-TLB Misses per Packet'),
-        ('L1 D-TLB misses per packet', 'L1 D-TLB Misses per Packet'),
-        ('instructions per packet', 'Instructions per Packet'),
-        ('Branch mis-pred per packet', 'Branch Mispredictions per Packet')
-    ]
-    
-    # Plot normalized cache metrics
-    for i, (metric, title) in enumerate(normalized_cache_metrics):
-        if metric in df1.columns and metric in df2.columns:
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    # Plot normalized cache metrics (per packet)
+    metrics = [metric for metric, _ in NORMALIZED_CACHE_METRICS]
+    scaled1, scaled2 = scaled_columns(df1, metrics), scaled_columns(df2, metrics)
+    for i, (metric, title) in enumerate(NORMALIZED_CACHE_METRICS):
+        if metric in scaled1 and metric in scaled2:
+            fig, ax1, ax2 = comparison_figure()
             
-            values1 = df1[metric]
-            values2 = df2[metric]
+            values1 = scaled1[metric]
+            values2 = scaled2[metric]
             
             create_comparison_plot(ax1, ax2, x_positions, x_labels, values1, values2,
                                   metric.replace('per packet', '/ Packet'), f'{title} vs Throughput',
@@ -330,23 +386,17 @@ def plot_cache_metrics(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Datas
 def plot_efficiency_metrics(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2'):
     """Plot efficiency metrics comparisons."""
     
-    efficiency_metrics = [
-        ('Cycles Per Packet', 'Cycles per Packet', True),
-        ('instructions per packet', 'Instructions per Packet', True),
-        ('Branch mis-pred per packet', 'Branch Mispredictions per Packet', True),
-        ('Mean RTT (μs)', 'Mean Round-Trip Time (μs)', False)  # Use line plot for RTT trends
-    ]
+    x_positions, x_labels = _axis_prep(df1)
     
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
+    metrics = [metric for metric, _, _ in EFFICIENCY_METRICS]
+    scaled1, scaled2 = scaled_columns(df1, metrics), scaled_columns(df2, metrics)
     
-    for i, (metric, title, use_bars) in enumerate(efficiency_metrics):
-        if metric in df1.columns and metric in df2.columns:
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    for i, (metric, title, use_bars) in enumerate(EFFICIENCY_METRICS):
+        if metric in scaled1 and metric in scaled2:
+            fig, ax1, ax2 = comparison_figure()
             
-            values1 = df1[metric]
-            values2 = df2[metric]
+            values1 = scaled1[metric]
+            values2 = scaled2[metric]
             
             ylabel = title
             create_comparison_plot(ax1, ax2, x_positions, x_labels, values1, values2,
@@ -358,22 +408,14 @@ def plot_efficiency_metrics(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='
 def plot_packet_metrics(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Dataset 2'):
     """Plot packet-related metrics comparisons."""
     
-    packet_metrics = [
-        ('Packet Rate (p/s)', 'Packet Rate (packets/s)', 1000),  # Convert to kpps
-        ('Recv Thrput (Mb/s)', 'Received Throughput (Mb/s)', 1),
-        ('Send Thrput (Mb/s)', 'Sent Throughput (Mb/s)', 1)
-    ]
-    
-    throughput = df1['Requ Thrput (Mb/s)']
-    x_positions = range(len(throughput))
-    x_labels = [f'{int(x)}' for x in throughput]
+    x_positions, x_labels = _axis_prep(df1)
     
-    for i, (metric, title, divisor) in enumerate(packet_metrics):
+    for i, (metric, title, divisor) in enumerate(PACKET_METRICS):
         if metric in df1.columns and metric in df2.columns:
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+            fig, ax1, ax2 = comparison_figure()
             
-            values1 = df1[metric] / divisor
-            values2 = df2[metric] / divisor
+            values1 = df1[metric].to_numpy(dtype=np.float64) / divisor
+            values2 = df2[metric].to_numpy(dtype=np.float64) / divisor
             
             ylabel = title.replace('(packets/s)', '(Kpps)') if divisor == 1000 else title
             create_comparison_plot(ax1, ax2, x_positions, x_labels, values1, values2,
@@ -383,19 +425,25 @@ def plot_packet_metrics(pdf, svg_dir, df1, df2, label1='Dataset 1', label2='Data
             save_plot(fig, pdf, svg_dir, f'10_{metric.lower().replace(" ", "_").replace("(", "").replace(")", "").replace("/", "_")}_packets')
 
 def main():
+    # Separate the --options from the positional arguments before counting them
+    emit_svg = '--svg' in sys.argv
+    args = [arg for arg in sys.argv if not arg.startswith('--')]
+    
     # Show usage if not enough arguments
-    if len(sys.argv) < 3 and len(sys.argv) != 1:
-        print("Usage: python plot_detailed_comparison.py <csv_file1> <csv_file2> [output_pdf] [label1] [label2]")
+    if len(args) < 3 and len(args) != 1:
+        print("Usage: python plot_detailed_comparison.py <csv_file1> <csv_file2> [output_pdf] [label1] [label2] [--svg]")
         print("Example: python plot_detailed_comparison.py baseline.csv optimized.csv comparison.pdf 'Baseline' 'Optimized'")
+        print("Options:")
+        print("  --svg    Also write each plot as an SVG into <output_pdf stem>_svgs/ (default: PDF only)")
         return
     
     # Parse command line arguments
-    if len(sys.argv) >= 3:
-        csv_file1 = Path(sys.argv[1])
-        csv_file2 = Path(sys.argv[2])
-        output_file = Path(sys.argv[3] if len(sys.argv) > 3 else 'detailed_comparison_plots.pdf')
-        label1 = sys.argv[4] if len(sys.argv) > 4 else 'DATA 1'
-        label2 = sys.argv[5] if len(sys.argv) > 5 else 'DATA 2'
+    if len(args) >= 3:
+        csv_file1 = Path(args[1])
+        csv_file2 = Path(args[2])
+        output_file = Path(args[3] if len(args) > 3 else 'detailed_comparison_plots.pdf')
+        label1 = args[4] if len(args) > 4 else 'DATA 1'
+        label2 = args[5] if len(args) > 5 else 'DATA 2'
     else:
         # Default: use the same file twice for demonstration
         csv_file1 = Path('microkit_output_with_components.csv')
@@ -416,34 +464,41 @@ def main():
     df1 = load_data(csv_file1)
     df2 = load_data(csv_file2)
     
-    # Create SVG directory alongside PDF
-    svg_dir = output_file.parent / (output_file.stem + '_svgs')
-    svg_dir.mkdir(exist_ok=True)
+    # Create SVG directory alongside PDF (only when SVGs are requested)
+    svg_dir = None
+    if emit_svg:
+        svg_dir = output_file.parent / (output_file.stem + '_svgs')
+        svg_dir.mkdir(exist_ok=True)
     
     # Create PDF with plots
     print(f"Generating detailed plots to {output_file}...")
-    print(f"Generating SVG files to {svg_dir}/")
+    if svg_dir:
+        print(f"Generating SVG files to {svg_dir}/")
+    plot_funcs = [
+        plot_instructions_per_second,
+        plot_throughput_vs_cpu,  # Special dual-axis plot
+        plot_comprehensive_cpu_utilization,  # System + all components
+        plot_cpu_utilization,
+        plot_cache_metrics,
+        plot_efficiency_metrics,
+        plot_packet_metrics,
+    ]
+    
     with PdfPages(output_file) as pdf:
-        # Instructions per second
-        plot_instructions_per_second(pdf, svg_dir, df1, df2, label1, label2)
-        
-        # Throughput vs CPU utilization (special dual-axis plot)
-        plot_throughput_vs_cpu(pdf, svg_dir, df1, df2, label1, label2)
-        
-        # Comprehensive CPU utilization (system + all components)
-        plot_comprehensive_cpu_utilization(pdf, svg_dir, df1, df2, label1, label2)
-        
-        # CPU utilization
-        plot_cpu_utilization(pdf, svg_dir, df1, df2, label1, label2)
-        
-        # Cache metrics
-        plot_cache_metrics(pdf, svg_dir, df1, df2, label1, label2)
-        
-        # Efficiency metrics
-        plot_efficiency_metrics(pdf, svg_dir, df1, df2, label1, label2)
-        
-        # Packet metrics
-        plot_packet_metrics(pdf, svg_dir, df1, df2, label1, label2)
+        if svg_dir and (os.cpu_count() or 1) > 1:
+            # The plot_* functions are independent, so render them across processes and
+            # add their pages to the PDF in the original order; workers only take the SVG
+            # work off this process, which still draws every PDF page
+            with ProcessPoolExecutor(max_workers=min(len(plot_funcs), os.cpu_count())) as executor:
+                futures = [executor.submit(render_pages, plot_func, svg_dir, df1, df2, label1, label2)
+                           for plot_func in plot_funcs]
+                for future in futures:
+                    for page in future.result():
+                        pdf.savefig(pickle.loads(page))
+        else:
+            # Without SVGs (or with one CPU), workers only add pickling and redraws: draw straight into the PDF
+            for plot_func in plot_funcs:
+                plot_func(pdf, svg_dir, df1, df2, label1, label2)
         
         # Add metadata to PDF
         d = pdf.infodict()
@@ -453,7 +508,8 @@ def main():
         d['Keywords'] = 'Performance, Instructions, CPU Utilization, Cache, Throughput'
     
     print(f"PDF saved to {output_file}")
-    print(f"SVG files saved to {svg_dir}/")
+    if svg_dir:
+        print(f"SVG files saved to {svg_dir}/")
     print("Detailed plot generation complete!")
 
 if __name__ == "__main__":
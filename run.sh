@@ -161,9 +161,10 @@ log_info "Generating comparative analysis..."
 log_info "  First dataset CSV: $CSV_FILE1" 
 log_info "  Second dataset CSV: $CSV_FILE2"
 log_info "  Output PDF: $PDF_FILE"
+log_info "  Output SVGs: ${PDF_FILE%.pdf}_svgs/"
 log_info "  Dataset labels: '$DATASET1_NAME' vs '$DATASET2_NAME'"
 
-if python plot.py "$CSV_FILE1" "$CSV_FILE2" "$PDF_FILE" "$DATASET1_NAME" "$DATASET2_NAME"; then
+if python plot.py "$CSV_FILE1" "$CSV_FILE2" "$PDF_FILE" "$DATASET1_NAME" "$DATASET2_NAME" --emit-svg; then
     log_success "Comparison analysis generation completed successfully"
 else
     log_error "Comparison analysis generation failed"
@@ -184,6 +185,7 @@ echo "Generated files:"
 echo "  📊 Dataset 1: $CSV_FILE1 ($DATA1_RECORDS records)"
 echo "  📊 Dataset 2: $CSV_FILE2 ($DATA2_RECORDS records)"
 echo "  📈 Comparison: $PDF_FILE ($PDF_SIZE)"
+echo "  🖼️  Per-plot SVGs: ${PDF_FILE%.pdf}_svgs/"
 echo ""
 echo "The comparison analysis includes:"
 echo "  • $DATA1_RECORDS vs $DATA2_RECORDS test iterations compared"